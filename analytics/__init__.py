@@ -0,0 +1,4 @@
+# app/analytics/__init__.py
+from app.analytics.irr import compute_irr, deal_irr
+
+__all__ = ["compute_irr", "deal_irr"]
@@ -0,0 +1,87 @@
+# app/analytics/irr.py
+from decimal import Decimal
+from typing import Optional, Sequence, Tuple
+
+# Search interval for the per-period rate; below -1 the discount factor is undefined
+IRR_LOWER_BOUND = -0.9999
+IRR_UPPER_BOUND = 10.0
+IRR_BRACKET_STEPS = 20
+
+
+def _npv_and_derivative(rate: float, cashflows: Sequence[float]) -> Tuple[float, float]:
+    """NPV at `rate` and its derivative d(NPV)/d(rate), in one Horner pass (no pow calls)"""
+    x = 1.0 / (1.0 + rate)
+    npv = 0.0
+    dnpv_dx = 0.0
+    # NPV is a polynomial in x = 1/(1+r); Horner evaluates it and its x-derivative together
+    for cf in reversed(cashflows):
+        dnpv_dx = dnpv_dx * x + npv
+        npv = npv * x + cf
+    # dx/dr = -x^2
+    return npv, -dnpv_dx * x * x
+
+
+def compute_irr(
+        cashflows: Sequence[float],
+        guess: float = 0.1,
+        tol: float = 1e-7,
+        maxiter: int = 50
+) -> Optional[float]:
+    """
+    Internal rate of return per period of `cashflows` (cashflows[0] is at t=0).
+
+    The root is first bracketed by a few bisection steps over
+    (IRR_LOWER_BOUND, IRR_UPPER_BOUND), then polished with Newton's method;
+    any Newton step that leaves the bracket falls back to bisection. Returns
+    None when the cashflows never change sign or the root is outside the
+    search interval.
+    """
+    cashflows = [float(cf) for cf in cashflows]
+    if not any(cf > 0 for cf in cashflows) or not any(cf < 0 for cf in cashflows):
+        return None
+
+    lo, hi = IRR_LOWER_BOUND, IRR_UPPER_BOUND
+    npv_lo = _npv_and_derivative(lo, cashflows)[0]
+    npv_hi = _npv_and_derivative(hi, cashflows)[0]
+    if npv_lo * npv_hi > 0:
+        return None
+
+    # Short bisection scan: narrows the bracket so Newton starts near the root
+    for _ in range(IRR_BRACKET_STEPS):
+        mid = (lo + hi) / 2
+        npv_mid = _npv_and_derivative(mid, cashflows)[0]
+        if npv_mid == 0:
+            return mid
+        if (npv_mid < 0) == (npv_lo < 0):
+            lo, npv_lo = mid, npv_mid
+        else:
+            hi = mid
+
+    rate = guess if lo < guess < hi else (lo + hi) / 2
+    for _ in range(maxiter):
+        npv, dnpv = _npv_and_derivative(rate, cashflows)
+        if npv == 0:
+            return rate
+        # Keep the bracket around the root so a bad Newton step can be replaced
+        if (npv < 0) == (npv_lo < 0):
+            lo, npv_lo = rate, npv
+        else:
+            hi = rate
+
+        step = npv / dnpv if dnpv else 0.0
+        new_rate = rate - step
+        if not dnpv or not lo < new_rate < hi:
+            new_rate = (lo + hi) / 2
+        if abs(new_rate - rate) < tol:
+            return new_rate
+        rate = new_rate
+
+    return None
+
+
+def deal_irr(cashflows: Sequence[float]) -> Optional[Decimal]:
+    """compute_irr rounded to 4 places as a Decimal, for DealPerformance.irr"""
+    irr = compute_irr(cashflows)
+    if irr is None:
+        return None
+    return Decimal(irr).quantize(Decimal("0.0001"))
@@ -0,0 +1,173 @@
+# app/cache.py
+import asyncio
+import functools
+import hashlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from pydantic import BaseModel
+from redis import asyncio as aioredis
+from sqlalchemy.exc import SQLAlchemyError
+
+REDIS_URL = "redis://localhost:6379/0"
+REDIS_MAX_CONNECTIONS = 50
+CACHE_PREFIX = "mca-cache"
+
+# TTL policies (seconds)
+CACHE_TTL_SHORT = 30
+CACHE_TTL_NORMAL = 120
+CACHE_TTL_LONG = 300
+
+# Last-known-good copies served when the database is slow or down (seconds)
+CACHE_TTL_STALE = 86400
+STALE_FALLBACK_TIMEOUT = 2.0
+
+# Namespaces, cleared by the writes that change the cached data
+PAYMENTS_NAMESPACE = "payments"
+PRINCIPALS_NAMESPACE = "principals"
+RENEWALS_NAMESPACE = "renewals"
+
+# Deletes every key matching ARGV[1] server-side, so clearing a namespace is one round trip
+_CLEAR_NAMESPACE_LUA = """
+local deleted = 0
+local cursor = "0"
+repeat
+    local page = redis.call("SCAN", cursor, "MATCH", ARGV[1], "COUNT", 500)
+    cursor = page[1]
+    for _, key in ipairs(page[2]) do
+        redis.call("UNLINK", key)
+        deleted = deleted + 1
+    end
+until cursor == "0"
+return deleted
+"""
+
+# Set by init_cache; None when another backend is in use (tests run on the in-memory one)
+_redis: Optional[aioredis.Redis] = None
+
+
+def request_key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        request: Optional[Request] = None,
+        response: Optional[Response] = None,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build a cache key from the request path and query string
+
+    The default key builder hashes every endpoint argument, including the
+    injected db session, so no two requests would ever share a key.
+    """
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    return f"{namespace}:{request.url.path}?{query}"
+
+
+def cache_with_stale_fallback(
+        expire: int,
+        namespace: str,
+        stale_ttl: int = CACHE_TTL_STALE,
+        timeout: float = STALE_FALLBACK_TIMEOUT
+):
+    """
+    Cache an expensive endpoint and fall back to its last good response.
+
+    A fresh copy is served for `expire` seconds. On a miss the endpoint gets
+    `timeout` seconds; if it times out or the database errors, the stale copy
+    (kept for `stale_ttl`, and not dropped by invalidate_cache) is returned with
+    X-Cache-Status: stale. The endpoint must take `request` and `response` params.
+
+    Every response carries an ETag of the stored bytes, and a matching
+    If-None-Match gets a 304, as fastapi-cache's @cache does.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"]
+            response: Response = kwargs["response"]
+            backend = FastAPICache.get_backend()
+            key = request_key_builder(func, f"{CACHE_PREFIX}:{namespace}", request=request)
+            stale_key = f"{CACHE_PREFIX}:stale:{key}"
+            response.headers["Cache-Control"] = f"max-age={expire}, stale-while-revalidate={stale_ttl}"
+
+            def not_modified(encoded: bytes, cache_status: str) -> Optional[Response]:
+                """Tag the response with the ETag of `encoded`; a 304 if the client already has it"""
+                response.headers["ETag"] = f'"{hashlib.blake2b(encoded, digest_size=8).hexdigest()}"'
+                response.headers["X-Cache-Status"] = cache_status
+                if etag_matches(request, response.headers["ETag"]):
+                    # A returned Response does not pick up the injected response's headers
+                    return Response(status_code=304, headers=dict(response.headers))
+                return None
+
+            cached = await backend.get(key)
+            if cached is not None:
+                return not_modified(cached, "hit") or orjson.loads(cached)
+
+            try:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
+            except (asyncio.TimeoutError, SQLAlchemyError):
+                stale = await backend.get(stale_key)
+                if stale is None:
+                    raise HTTPException(status_code=503, detail="Service temporarily unavailable")
+                return not_modified(stale, "stale") or orjson.loads(stale)
+
+            # Response models serialize straight to JSON in pydantic-core (same output
+            # as jsonable_encoder, without the intermediate Python dict)
+            if isinstance(result, BaseModel):
+                encoded = result.model_dump_json().encode()
+            else:
+                encoded = orjson.dumps(jsonable_encoder(result))
+            await backend.set(key, encoded, expire)
+            await backend.set(stale_key, encoded, stale_ttl)
+            return not_modified(encoded, "miss") or result
+
+        return wrapper
+
+    return decorator
+
+
+def rows_etag(rows, *extra) -> str:
+    """ETag for a list response: every column value of its rows, plus `extra` (e.g. the total)"""
+    digest = hashlib.blake2b(repr(extra).encode(), digest_size=8)
+    for row in rows:
+        digest.update(repr(tuple(getattr(row, column.key) for column in row.__table__.columns)).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def resource_etag(obj) -> str:
+    """ETag for a single row, from all of its column values"""
+    # Not just updated_at: SQLite stores func.now() to the second, so an edit in the same
+    # second as the previous read would keep the old ETag
+    return rows_etag((obj,))
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when the client already holds this version (conditional GET)"""
+    return request.headers.get("if-none-match") == etag
+
+
+async def init_cache(redis_url: str = REDIS_URL):
+    """Initialize the Redis response cache (call from the app lifespan)"""
+    global _redis
+    # Non-blocking asyncio client with a bounded connection pool shared by every request
+    _redis = aioredis.from_url(redis_url, decode_responses=False, max_connections=REDIS_MAX_CONNECTIONS)
+    FastAPICache.init(RedisBackend(_redis), prefix=CACHE_PREFIX, key_builder=request_key_builder)
+
+
+async def invalidate_cache(*namespaces: str):
+    """Drop every cached response under the given namespaces"""
+    if _redis is None:
+        for namespace in namespaces:
+            await FastAPICache.clear(namespace=namespace)
+        return
+
+    # All namespaces are cleared in one pipelined round trip
+    async with _redis.pipeline(transaction=False) as pipe:
+        for namespace in namespaces:
+            pipe.eval(_CLEAR_NAMESPACE_LUA, 0, f"{CACHE_PREFIX}:{namespace}:*")
+        await pipe.execute()
@@ -1,6 +1,6 @@
 # app/crud/banking.py
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, select, update, lambda_stmt
 from typing import List, Optional
 from app.models.banking import BankAccount
 from app.schemas.banking import BankAccountCreate, BankAccountUpdate
@@ -8,6 +8,16 @@ import datetime
 from fastapi import HTTPException
 
 
+# Columns needed to build the BankAccountResponse schema - used by read-only list queries
+BANK_ACCOUNT_COLS = (
+    BankAccount.id, BankAccount.merchant_id,
+    BankAccount.account_name, BankAccount.account_number, BankAccount.routing_number,
+    BankAccount.bank_name, BankAccount.account_type,
+    BankAccount.is_active, BankAccount.is_primary,
+    BankAccount.created_at, BankAccount.updated_at
+)
+
+
 class CRUDBankAccount:
     def create(
             self,
@@ -34,15 +44,19 @@ class CRUDBankAccount:
         return db_bank_account
 
     def get(self, db: Session, bank_account_id: int, include_deleted: bool = False) -> Optional[BankAccount]:
-        query = db.query(BankAccount).filter(
+        # lambda_stmt caches the constructed statement; bank_account_id becomes a bound parameter.
+        # Routes read bank_account.merchant for merchant_name, so join it in (many-to-one)
+        stmt = lambda_stmt(lambda: select(BankAccount).options(
+            joinedload(BankAccount.merchant)
+        ).where(
             BankAccount.id == bank_account_id
-        )
+        ))
 
         # By default, exclude deleted records
         if not include_deleted:
-            query = query.filter(BankAccount.is_deleted == False)
+            stmt += lambda s: s.where(BankAccount.is_deleted == False)
 
-        return query.first()
+        return db.execute(stmt).scalars().first()
 
     def get_by_merchant(
             self,
@@ -66,6 +80,26 @@ class CRUDBankAccount:
 
         return query.offset(skip).limit(limit).all()
 
+    def get_rows_by_merchant(
+            self,
+            db: Session,
+            merchant_id: int,
+            skip: int = 0,
+            limit: int = 100,
+            active_only: bool = False,
+            include_deleted: bool = False
+    ) -> list:
+        """Same as get_by_merchant but returns plain column mappings instead of ORM instances"""
+        stmt = select(*BANK_ACCOUNT_COLS).where(BankAccount.merchant_id == merchant_id)
+
+        if not include_deleted:
+            stmt = stmt.where(BankAccount.is_deleted == False)
+
+        if active_only:
+            stmt = stmt.where(BankAccount.is_active == True)
+
+        return db.execute(stmt.offset(skip).limit(limit)).mappings().all()
+
     def update(
             self,
             db: Session,
@@ -143,26 +177,30 @@ class CRUDBankAccount:
             merchant_id: int,
             bank_account_id: int
     ) -> Optional[BankAccount]:
-        # Unset all primary accounts for this merchant
-        db.query(BankAccount).filter(
-            and_(
-                BankAccount.merchant_id == merchant_id,
-                BankAccount.is_primary == True
-            )
-        ).update({"is_primary": False})
+        # Single UPDATE: the chosen account becomes primary, every other account of the merchant is unset
+        db.execute(
+            update(BankAccount)
+            .where(BankAccount.merchant_id == merchant_id)
+            .values(is_primary=(BankAccount.id == bank_account_id))
+        )
 
-        # Set the new primary
-        db_bank_account = db.query(BankAccount).filter(
-            and_(
-                BankAccount.id == bank_account_id,
-                BankAccount.merchant_id == merchant_id
+        db_bank_account = db.execute(
+            select(BankAccount)
+            .where(
+                and_(
+                    BankAccount.id == bank_account_id,
+                    BankAccount.merchant_id == merchant_id
+                )
             )
-        ).first()
+            .options(selectinload(BankAccount.merchant))
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
 
         if db_bank_account:
-            db_bank_account.is_primary = True
             db.commit()
-            db.refresh(db_bank_account)
+        else:
+            # Account is not the merchant's - don't leave the merchant without a primary
+            db.rollback()
 
         return db_bank_account
 
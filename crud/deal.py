@@ -1,15 +1,30 @@
 # app/crud/deal.py
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, select, case, lambda_stmt
 from app.models.deal import Deal as DealModel
+from app.models.merchant import Merchant as MerchantModel
 from app.models.offer import Offer as OfferModel
 from app.models.payment import Payment as PaymentModel
 from app.schemas.deal import DealCreate, DealUpdate, DealFilter, DealSummary
-from typing import List, Optional
+from typing import List, Optional, NamedTuple
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 
 
+# Columns needed to build the Deal response schema - used by read-only list queries
+DEAL_COLS = (
+    DealModel.id, DealModel.deal_number,
+    DealModel.merchant_id, DealModel.offer_id, DealModel.bank_account_id,
+    DealModel.funded_amount, DealModel.factor_rate, DealModel.rtr_amount,
+    DealModel.payment_amount, DealModel.payment_frequency, DealModel.number_of_payments,
+    DealModel.funding_date, DealModel.first_payment_date, DealModel.maturity_date,
+    DealModel.total_paid, DealModel.balance_remaining, DealModel.payments_remaining,
+    DealModel.last_payment_date, DealModel.status, DealModel.actual_completion_date,
+    DealModel.in_collections, DealModel.collections_notes,
+    DealModel.notes, DealModel.created_by, DealModel.created_at, DealModel.updated_at
+)
+
+
 def generate_deal_number(db: Session) -> str:
     """Generate a unique deal number"""
     current_year = datetime.now().year
@@ -45,10 +60,45 @@ def calculate_maturity_date(funding_date: date, payment_frequency: str, number_o
         return funding_date + timedelta(days=number_of_payments)
 
 
-def create_deal(db: Session, deal: DealCreate) -> DealModel:
-    """Create a new deal from an accepted offer"""
+class DealCreateContext(NamedTuple):
+    """Validation state of the merchant and offer referenced by a new deal"""
+    merchant_exists: bool
+    offer_exists: bool
+    offer_status: Optional[str]
+    offer_belongs: bool
+    offer: Optional[OfferModel]
+
+
+def load_create_context(db: Session, merchant_id: int, offer_id: int) -> DealCreateContext:
+    """Load merchant and offer validation state for deal creation in a single query"""
+    row = db.query(MerchantModel.id, OfferModel).select_from(MerchantModel).outerjoin(
+        OfferModel,
+        and_(
+            OfferModel.id == offer_id,
+            OfferModel.is_deleted == False
+        )
+    ).filter(
+        and_(
+            MerchantModel.id == merchant_id,
+            MerchantModel.is_deleted == False
+        )
+    ).first()
+
+    if row is None:
+        return DealCreateContext(False, False, None, False, None)
+
+    offer = row[1]
+    if offer is None:
+        return DealCreateContext(True, False, None, False, None)
+
+    return DealCreateContext(True, True, offer.status, offer.merchant_id == merchant_id, offer)
+
+
+def create_deal(db: Session, deal: DealCreate, offer: Optional[OfferModel] = None) -> DealModel:
+    """Create a new deal from an accepted offer (pass the already-loaded offer to skip the lookup)"""
     # Get the offer details
-    offer = db.query(OfferModel).filter(OfferModel.id == deal.offer_id).first()
+    if offer is None:
+        offer = db.query(OfferModel).filter(OfferModel.id == deal.offer_id).first()
     if not offer:
         raise ValueError("Offer not found")
 
@@ -111,7 +161,30 @@ def create_deal(db: Session, deal: DealCreate) -> DealModel:
 
 def get_deal(db: Session, deal_id: int) -> Optional[DealModel]:
     """Get a specific deal by ID"""
-    return db.query(DealModel).filter(DealModel.id == deal_id).first()
+    # lambda_stmt caches the constructed statement; deal_id becomes a bound parameter
+    stmt = lambda_stmt(lambda: select(DealModel).where(DealModel.id == deal_id))
+    return db.execute(stmt).scalars().first()
+
+
+def get_deal_with_payment_columns(db: Session, deal_id: int, include_deleted: bool = False) -> Optional[dict]:
+    """Get a deal row plus its payments as parallel column lists (no ORM instances)"""
+    deal = db.execute(select(*DEAL_COLS).where(DealModel.id == deal_id)).mappings().first()
+    if not deal:
+        return None
+
+    stmt = select(
+        PaymentModel.id, PaymentModel.date, PaymentModel.amount, PaymentModel.type, PaymentModel.bounced
+    ).where(PaymentModel.deal_id == deal_id)
+    if not include_deleted:
+        stmt = stmt.where(PaymentModel.is_deleted == False)
+    rows = db.execute(stmt.order_by(PaymentModel.date.desc(), PaymentModel.id.desc())).all()
+
+    # Transpose rows into columns; empty lists when the deal has no payments
+    ids, dates, amounts, types, bounced = (list(column) for column in zip(*rows)) if rows else ([],) * 5
+    return {
+        **deal,
+        "payment_columns": {"ids": ids, "dates": dates, "amounts": amounts, "types": types, "bounced": bounced}
+    }
 
 
 def get_deal_by_number(db: Session, deal_number: str) -> Optional[DealModel]:
@@ -119,15 +192,8 @@ def get_deal_by_number(db: Session, deal_number: str) -> Optional[DealModel]:
     return db.query(DealModel).filter(DealModel.deal_number == deal_number).first()
 
 
-def get_deals(
-        db: Session,
-        skip: int = 0,
-        limit: int = 100,
-        filters: Optional[DealFilter] = None
-) -> List[DealModel]:
-    """Get deals with optional filtering"""
-    query = db.query(DealModel)
-
+def _apply_deal_filters(query, filters: Optional[DealFilter]):
+    """Apply DealFilter criteria to an ORM query or a select() statement"""
     if filters:
         if filters.merchant_id:
             query = query.filter(DealModel.merchant_id == filters.merchant_id)
@@ -143,15 +209,44 @@ def get_deals(
             query = query.filter(DealModel.funded_amount <= filters.max_amount)
         if filters.in_collections is not None:
             query = query.filter(DealModel.in_collections == filters.in_collections)
+    return query
+
 
+def get_deals(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[DealFilter] = None
+) -> List[DealModel]:
+    """Get deals with optional filtering"""
+    query = _apply_deal_filters(db.query(DealModel), filters)
     return query.order_by(DealModel.funding_date.desc()).offset(skip).limit(limit).all()
 
 
+def get_deal_rows(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[DealFilter] = None
+) -> list:
+    """Get deals as plain column mappings (read-only, no ORM instances)"""
+    stmt = _apply_deal_filters(select(*DEAL_COLS), filters)
+    stmt = stmt.order_by(DealModel.funding_date.desc()).offset(skip).limit(limit)
+    return db.execute(stmt).mappings().all()
+
+
 def get_active_deals(db: Session) -> List[DealModel]:
     """Get all active deals"""
     return db.query(DealModel).filter(DealModel.status == "active").all()
 
 
+def get_active_deal_rows(db: Session) -> list:
+    """Get all active deals as plain column mappings (read-only, no ORM instances)"""
+    return db.execute(
+        select(*DEAL_COLS).where(DealModel.status == "active")
+    ).mappings().all()
+
+
 def get_deals_by_merchant(db: Session, merchant_id: int) -> List[DealModel]:
     """Get all deals for a specific merchant"""
     return db.query(DealModel).filter(
@@ -159,6 +254,16 @@ def get_deals_by_merchant(db: Session, merchant_id: int) -> List[DealModel]:
     ).order_by(DealModel.funding_date.desc()).all()
 
 
+def get_renewal_deals_by_merchant(db: Session, merchant_id: int) -> List[DealModel]:
+    """Get only the renewal deals for a specific merchant"""
+    return db.scalars(
+        select(DealModel).where(
+            DealModel.merchant_id == merchant_id,
+            DealModel.is_renewal == True
+        ).order_by(DealModel.funding_date.desc())
+    ).all()
+
+
 def update_deal(db: Session, deal_id: int, deal_update: DealUpdate) -> Optional[DealModel]:
     """Update a deal"""
     db_deal = db.query(DealModel).filter(DealModel.id == deal_id).first()
@@ -216,10 +321,28 @@ def update_deal_balance(db: Session, deal_id: int) -> Optional[DealModel]:
 
 
 def get_deal_summary(db: Session) -> DealSummary:
-    """Get summary statistics for all deals"""
-    deals = db.query(DealModel).all()
+    """Get summary statistics for all deals (aggregated in SQL, no rows loaded)"""
+    def status_count(status: str):
+        return func.sum(case((DealModel.status == status, 1), else_=0))
+
+    row = db.execute(
+        select(
+            func.count(DealModel.id),
+            status_count("active"),
+            status_count("completed"),
+            status_count("defaulted"),
+            func.sum(DealModel.funded_amount),
+            func.sum(DealModel.total_paid),
+            func.sum(case((DealModel.status == "active", DealModel.balance_remaining), else_=0)),
+            func.avg(DealModel.factor_rate),
+            func.avg(DealModel.funded_amount)
+        )
+    ).one()
 
-    if not deals:
+    (total_deals, active_deals, completed_deals, defaulted_deals, total_funded,
+     total_collected, total_outstanding, average_factor_rate, average_deal_size) = row
+
+    if not total_deals:
         return DealSummary(
             total_deals=0,
             active_deals=0,
@@ -233,30 +356,17 @@ def get_deal_summary(db: Session) -> DealSummary:
             completion_rate=0.0
         )
 
-    active_deals = [d for d in deals if d.status == "active"]
-    completed_deals = [d for d in deals if d.status == "completed"]
-    defaulted_deals = [d for d in deals if d.status == "defaulted"]
-
-    total_funded = sum(d.funded_amount for d in deals)
-    total_collected = sum(d.total_paid for d in deals)
-    total_outstanding = sum(d.balance_remaining for d in active_deals)
-
-    average_factor_rate = sum(d.factor_rate for d in deals) / len(deals)
-    average_deal_size = total_funded / len(deals)
-
-    completion_rate = (len(completed_deals) / len(deals) * 100) if deals else 0
-
     return DealSummary(
-        total_deals=len(deals),
-        active_deals=len(active_deals),
-        completed_deals=len(completed_deals),
-        defaulted_deals=len(defaulted_deals),
-        total_funded=total_funded,
-        total_collected=total_collected,
-        total_outstanding=total_outstanding,
-        average_factor_rate=average_factor_rate,
-        average_deal_size=average_deal_size,
-        completion_rate=completion_rate
+        total_deals=total_deals,
+        active_deals=active_deals,
+        completed_deals=completed_deals,
+        defaulted_deals=defaulted_deals,
+        total_funded=total_funded or Decimal('0'),
+        total_collected=total_collected or Decimal('0'),
+        total_outstanding=total_outstanding or Decimal('0'),
+        average_factor_rate=average_factor_rate or Decimal('0'),
+        average_deal_size=average_deal_size or Decimal('0'),
+        completion_rate=completed_deals / total_deals * 100
     )
 
 
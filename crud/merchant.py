@@ -1,6 +1,6 @@
 # app/crud/merchant.py - Updated for soft deletes
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, select, lambda_stmt
 from app.models.merchant import Merchant
 from app.schemas.merchant import MerchantCreate, MerchantUpdate
 from datetime import datetime
@@ -47,12 +47,14 @@ def create_merchant(db: Session, merchant: MerchantCreate) -> Merchant:
 
 def get_merchant(db: Session, merchant_id: int) -> Merchant:
     """Get merchant by ID (only active merchants)"""
-    return db.query(Merchant).filter(
+    # lambda_stmt caches the constructed statement; merchant_id becomes a bound parameter
+    stmt = lambda_stmt(lambda: select(Merchant).where(
         and_(
             Merchant.id == merchant_id,
             Merchant.is_deleted == False
         )
-    ).first()
+    ))
+    return db.execute(stmt).scalars().first()
 
 
 def get_merchant_by_fein(db: Session, fein: str) -> Merchant:
@@ -65,18 +67,9 @@ def get_merchant_by_fein(db: Session, fein: str) -> Merchant:
     ).first()
 
 
-def get_merchants(
-        db: Session,
-        skip: int = 0,
-        limit: int = 100,
-        status: str = None,
-        search: str = None,
-        sort_by: str = "created_at",
-        sort_order: str = "desc"
-) -> list[Merchant]:
-    """Get merchants with filtering and pagination (only active merchants)"""
-
-    query = db.query(Merchant).filter(Merchant.is_deleted == False)
+def _apply_merchant_filters(query, status: str = None, search: str = None):
+    """Apply the active/status/search filters shared by the merchant list queries"""
+    query = query.filter(Merchant.is_deleted == False)
 
     # Apply status filter
     if status:
@@ -94,7 +87,11 @@ def get_merchants(
             )
         )
 
-    # Apply sorting
+    return query
+
+
+def _apply_merchant_sort(query, sort_by: str = "created_at", sort_order: str = "desc"):
+    """Apply the merchant list ordering"""
     if sort_by == "company_name":
         order_col = Merchant.company_name
     elif sort_by == "status":
@@ -105,32 +102,54 @@ def get_merchants(
         order_col = Merchant.created_at
 
     if sort_order == "desc":
-        query = query.order_by(order_col.desc())
-    else:
-        query = query.order_by(order_col.asc())
+        return query.order_by(order_col.desc())
+    return query.order_by(order_col.asc())
+
+
+def get_merchants(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        status: str = None,
+        search: str = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc"
+) -> list[Merchant]:
+    """Get merchants with filtering and pagination (only active merchants)"""
+    query = _apply_merchant_filters(db.query(Merchant), status, search)
+    query = _apply_merchant_sort(query, sort_by, sort_order)
 
     return query.offset(skip).limit(limit).all()
 
 
-def count_merchants(db: Session, status: str = None, search: str = None) -> int:
-    """Count merchants with filters (only active merchants)"""
-    query = db.query(Merchant).filter(Merchant.is_deleted == False)
+def get_merchants_with_total(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        status: str = None,
+        search: str = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc"
+) -> tuple[list[Merchant], int]:
+    """Get a page of merchants plus the total match count from the same query"""
+    # COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so every row carries the full total
+    query = _apply_merchant_filters(
+        db.query(Merchant, func.count().over().label("total")), status, search
+    )
+    query = _apply_merchant_sort(query, sort_by, sort_order)
 
-    if status:
-        query = query.filter(Merchant.status == status)
+    rows = query.offset(skip).limit(limit).all()
+    if rows:
+        return [row.Merchant for row in rows], rows[0].total
 
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Merchant.company_name.ilike(search_term),
-                Merchant.contact_person.ilike(search_term),
-                Merchant.email.ilike(search_term),
-                Merchant.fein.ilike(search_term)
-            )
-        )
+    # Past the last page there are no rows to read the total from
+    total = count_merchants(db, status=status, search=search) if skip else 0
+    return [], total
 
-    return query.count()
+
+def count_merchants(db: Session, status: str = None, search: str = None) -> int:
+    """Count merchants with filters (only active merchants)"""
+    return _apply_merchant_filters(db.query(Merchant), status, search).count()
 
 
 def update_merchant(
@@ -1,11 +1,14 @@
 # app/crud/offer.py
 from sqlalchemy.orm import Session
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from app.models.offer import Offer
+from app.database import list_load_options
 from app.schemas.offer import OfferCreate, OfferUpdate
 from decimal import Decimal
 from datetime import datetime
 from fastapi import HTTPException
+from typing import Optional
 
 
 def calculate_offer_fields(offer_data: dict) -> dict:
@@ -69,17 +72,33 @@ def get_offer(db: Session, offer_id: int):
     return db.query(Offer).filter(Offer.id == offer_id, Offer.is_deleted == False).first()
 
 
-def get_offers(db: Session, skip: int = 0, limit: int = 100):
-    """Get all offers with pagination"""
-    return db.query(Offer).filter(Offer.is_deleted == False).offset(skip).limit(limit).all()
+def get_offers(db: Session, cursor: Optional[int] = None, limit: int = 100):
+    """Get a page of offers (newest first) and the id to pass as the next cursor"""
+    query = db.query(Offer).filter(Offer.is_deleted == False)
 
+    # Keyset pagination on the primary key instead of OFFSET
+    if cursor:
+        query = query.filter(Offer.id < cursor)
 
-def get_offers_by_merchant(db: Session, merchant_id: int):
-    """Get all offers for a merchant"""
-    return db.query(Offer).filter(
+    # One extra row tells us whether there is a next page
+    rows = query.order_by(Offer.id.desc()).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, rows[-1].id
+    return rows, None
+
+
+def offers_by_merchant_stmt(merchant_id: int):
+    """select() of all offers for a merchant"""
+    return select(Offer).options(*list_load_options()).where(
         Offer.merchant_id == merchant_id,
         Offer.is_deleted == False
-    ).all()
+    )
+
+
+def get_offers_by_merchant(db: Session, merchant_id: int):
+    """Get all offers for a merchant"""
+    return db.scalars(offers_by_merchant_stmt(merchant_id)).all()
 
 
 def get_selected_offer_by_merchant(db: Session, merchant_id: int):
@@ -136,6 +155,31 @@ def update_offer(db: Session, offer_id: int, offer_update: OfferUpdate):
     return db_offer
 
 
+# Timestamp column stamped when an offer enters each status
+STATUS_TIMESTAMPS = {
+    "sent": Offer.sent_at,
+    "selected": Offer.selected_at,
+    "funded": Offer.funded_at,
+}
+
+
+def set_status(db: Session, offer_id: int, status: str):
+    """Set an offer's status in a single UPDATE ... RETURNING (no read before the write)"""
+    now = datetime.utcnow()
+    values = {Offer.status: status, Offer.updated_at: now}
+    if status in STATUS_TIMESTAMPS:
+        values[STATUS_TIMESTAMPS[status]] = now
+
+    db_offer = db.execute(
+        update(Offer)
+        .where(Offer.id == offer_id, Offer.is_deleted == False)
+        .values(values)
+        .returning(Offer)
+    ).scalar_one_or_none()
+    db.commit()
+    return db_offer
+
+
 def delete_offer(db: Session, offer_id: int):
     """Soft delete an offer"""
     db_offer = get_offer(db, offer_id)
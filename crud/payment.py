@@ -1,11 +1,13 @@
 # app/crud/payment.py
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import Float, and_, case, cast, or_, func, select
 from app.models.payment import Payment as PaymentModel
+from app.database import list_load_options
 from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentFilter, PaymentSummary
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
+import base64
 
 
 def create_payment(db: Session, payment: PaymentCreate) -> PaymentModel:
@@ -17,6 +19,23 @@ def create_payment(db: Session, payment: PaymentCreate) -> PaymentModel:
     return db_payment
 
 
+def create_payments_bulk(db: Session, payments: List[PaymentCreate]) -> List[PaymentModel]:
+    """Create several payment records in one transaction"""
+    db_payments = [PaymentModel(**payment.model_dump()) for payment in payments]
+    db.add_all(db_payments)
+    db.flush()  # One batched INSERT for the whole list
+    ids = [db_payment.id for db_payment in db_payments]
+    db.commit()
+
+    # Load server defaults (created_at) for every row in one query instead of a refresh per row
+    return db.scalars(
+        select(PaymentModel)
+        .where(PaymentModel.id.in_(ids))
+        .order_by(PaymentModel.id)
+        .execution_options(populate_existing=True)
+    ).all()
+
+
 def get_payment(db: Session, payment_id: int, include_deleted: bool = False) -> Optional[PaymentModel]:
     """Get a specific payment by ID"""
     query = db.query(PaymentModel).filter(PaymentModel.id == payment_id)
@@ -26,16 +45,23 @@ def get_payment(db: Session, payment_id: int, include_deleted: bool = False) ->
 
     return query.first()
 
-def get_payments(
-        db: Session,
-        skip: int = 0,
-        limit: int = 100,
-        filters: Optional[PaymentFilter] = None,
-        include_deleted: bool = False
-) -> List[PaymentModel]:
-    """Get payments with optional filtering"""
-    query = db.query(PaymentModel)
+def encode_payment_cursor(payment: PaymentModel) -> str:
+    """Opaque keyset cursor for the (date, id) sort key of a payment"""
+    raw = f"{payment.date.isoformat()}|{payment.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
+
+def decode_payment_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor from encode_payment_cursor; raises ValueError if malformed"""
+    try:
+        date_part, id_part = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(date_part), int(id_part)
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _apply_payment_filters(query, filters: Optional[PaymentFilter] = None, include_deleted: bool = False):
+    """Apply the soft-delete and PaymentFilter conditions (works on Query and select())"""
     if not include_deleted:
         query = query.filter(PaymentModel.is_deleted == False)
 
@@ -55,47 +81,80 @@ def get_payments(
         if filters.max_amount:
             query = query.filter(PaymentModel.amount <= filters.max_amount)
 
-    return query.order_by(PaymentModel.date.desc()).offset(skip).limit(limit).all()
+    return query
 
 
-def get_payments_by_deal(db: Session, deal_id: int, include_deleted: bool = False) -> List[PaymentModel]:
-    """Get all payments for a specific deal"""
-    query = db.query(PaymentModel).filter(PaymentModel.deal_id == deal_id)
+def get_payments(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[PaymentFilter] = None,
+        include_deleted: bool = False
+) -> Tuple[List[PaymentModel], Optional[str]]:
+    """Get a page of payments (newest first) and the cursor for the next page"""
+    query = _apply_payment_filters(db.query(PaymentModel), filters, include_deleted)
+
+    # Keyset pagination: seek past the last (date, id) seen instead of OFFSET
+    if cursor:
+        last_date, last_id = decode_payment_cursor(cursor)
+        query = query.filter(
+            or_(
+                PaymentModel.date < last_date,
+                and_(PaymentModel.date == last_date, PaymentModel.id < last_id)
+            )
+        )
+
+    # One extra row tells us whether there is a next page
+    rows = query.order_by(PaymentModel.date.desc(), PaymentModel.id.desc()).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_payment_cursor(rows[-1])
+    return rows, None
+
+
+def payments_export_stmt(filters: Optional[PaymentFilter] = None, include_deleted: bool = False):
+    """select() of every payment matching the filters, newest first - for streamed exports"""
+    stmt = _apply_payment_filters(select(PaymentModel).options(*list_load_options()), filters, include_deleted)
+    return stmt.order_by(PaymentModel.date.desc(), PaymentModel.id.desc())
+
+
+def payments_by_deal_stmt(deal_id: int, include_deleted: bool = False):
+    """select() of all payments for a specific deal, newest first"""
+    stmt = select(PaymentModel).options(*list_load_options()).where(PaymentModel.deal_id == deal_id)
 
     if not include_deleted:
-        query = query.filter(PaymentModel.is_deleted == False)
+        stmt = stmt.where(PaymentModel.is_deleted == False)
 
-    return query.order_by(PaymentModel.date.desc()).all()
+    return stmt.order_by(PaymentModel.date.desc())
+
+
+def get_payments_by_deal(db: Session, deal_id: int, include_deleted: bool = False) -> List[PaymentModel]:
+    """Get all payments for a specific deal"""
+    return db.scalars(payments_by_deal_stmt(deal_id, include_deleted)).all()
 
 
 def get_payment_summary_by_deal(db: Session, deal_id: int, include_deleted: bool = False) -> PaymentSummary:
-    """Get payment summary statistics for a deal"""
-    payments = db.query(PaymentModel).filter(PaymentModel.deal_id == deal_id).all()
+    """Get payment summary statistics for a deal (aggregated in SQL, no rows loaded)"""
+    stmt = select(
+        func.count(PaymentModel.id),
+        func.sum(PaymentModel.amount),
+        func.sum(case((PaymentModel.bounced == True, 1), else_=0)),
+        func.sum(case((PaymentModel.bounced == True, PaymentModel.amount), else_=0)),
+        func.max(PaymentModel.date)
+    ).where(PaymentModel.deal_id == deal_id)
 
     if not include_deleted:
-        payments = payments.filter(PaymentModel.is_deleted == False)
-
-    if not payments:
-        return PaymentSummary(
-            total_payments=0,
-            total_amount=Decimal('0'),
-            total_bounced=0,
-            bounced_amount=Decimal('0'),
-            last_payment_date=None,
-            average_payment=None
-        )
+        stmt = stmt.where(PaymentModel.is_deleted == False)
 
-    total_amount = sum(p.amount for p in payments)
-    bounced_payments = [p for p in payments if p.bounced]
-    bounced_amount = sum(p.amount for p in bounced_payments)
+    total_payments, total_amount, total_bounced, bounced_amount, last_payment_date = db.execute(stmt).one()
 
+    # average_payment is computed by the schema from the totals
     return PaymentSummary(
-        total_payments=len(payments),
-        total_amount=total_amount,
-        total_bounced=len(bounced_payments),
-        bounced_amount=bounced_amount,
-        last_payment_date=max(p.date for p in payments),
-        average_payment=total_amount / len(payments) if payments else None
+        total_payments=total_payments,
+        total_amount=total_amount or Decimal('0'),
+        total_bounced=total_bounced or 0,
+        bounced_amount=bounced_amount or Decimal('0'),
+        last_payment_date=last_payment_date
     )
 
 
@@ -187,19 +246,19 @@ def delete_payment(db: Session, payment_id: int, deleted_by: str = None) -> bool
     return False
 
 
-def get_payment_stats_by_type(db: Session, deal_id: Optional[int] = None):
-    """Get payment statistics grouped by payment type"""
-    query = db.query(
+def get_payment_stats_by_type(db: Session, deal_id: Optional[int] = None) -> list:
+    """Get payment statistics grouped by payment type (as column mappings, amounts already floats)"""
+    stmt = select(
         PaymentModel.type,
         func.count(PaymentModel.id).label('count'),
-        func.sum(PaymentModel.amount).label('total_amount'),
-        func.avg(PaymentModel.amount).label('avg_amount')
+        cast(func.coalesce(func.sum(PaymentModel.amount), 0), Float).label('total_amount'),
+        cast(func.coalesce(func.avg(PaymentModel.amount), 0), Float).label('avg_amount')
     )
 
     if deal_id:
-        query = query.filter(PaymentModel.deal_id == deal_id)
+        stmt = stmt.where(PaymentModel.deal_id == deal_id)
 
-    return query.group_by(PaymentModel.type).all()
+    return db.execute(stmt.group_by(PaymentModel.type)).mappings().all()
 
 
 def restore_payment(db: Session, payment_id: int) -> Optional[PaymentModel]:
@@ -1,9 +1,10 @@
 # app/crud/principal.py
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func, select
 from app.models.principal import Principal as PrincipalModel
 from app.models.merchant import Merchant as MerchantModel
+from app.database import list_load_options
 from app.schemas.principal import PrincipalCreate, PrincipalUpdate
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -11,6 +12,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Principal response columns with the SSN masked in SQL - the full SSN never leaves the database
+MASKED_PRINCIPAL_COLS = (
+    PrincipalModel.id, PrincipalModel.merchant_id,
+    PrincipalModel.first_name, PrincipalModel.last_name, PrincipalModel.ownership_percentage,
+    (func.substr(PrincipalModel.ssn, 1, 3) + "-XX-XXXX").label("ssn"),
+    PrincipalModel.date_of_birth,
+    PrincipalModel.home_address, PrincipalModel.city, PrincipalModel.state, PrincipalModel.zip,
+    PrincipalModel.phone, PrincipalModel.email,
+    PrincipalModel.is_primary_contact, PrincipalModel.is_guarantor,
+    PrincipalModel.created_at, PrincipalModel.updated_at
+)
+
 
 class PrincipalCRUDError(Exception):
     """Custom exception for principal CRUD operations"""
@@ -125,7 +138,9 @@ def get_principals_by_merchant(
 ) -> List[PrincipalModel]:
     """Get all principals for a merchant"""
     try:
-        query = db.query(PrincipalModel).filter(PrincipalModel.merchant_id == merchant_id)
+        query = db.query(PrincipalModel).options(*list_load_options()).filter(
+            PrincipalModel.merchant_id == merchant_id
+        )
 
         if only_guarantors:
             query = query.filter(PrincipalModel.is_guarantor == True)
@@ -149,6 +164,17 @@ def get_principals_by_ssn(db: Session, ssn: str) -> List[PrincipalModel]:
         raise PrincipalCRUDError(f"Failed to fetch principals: {str(e)}")
 
 
+def get_masked_principal_rows_by_ssn(db: Session, ssn: str) -> list:
+    """Same as get_principals_by_ssn but returns column mappings with the SSN masked (123-XX-XXXX)"""
+    try:
+        return db.execute(
+            select(*MASKED_PRINCIPAL_COLS).where(PrincipalModel.ssn == ssn)
+        ).mappings().all()
+    except SQLAlchemyError as e:
+        logger.error(f"Error fetching principals by SSN: {str(e)}")
+        raise PrincipalCRUDError(f"Failed to fetch principals: {str(e)}")
+
+
 def update_principal(
         db: Session,
         principal_id: int,
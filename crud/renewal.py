@@ -1,16 +1,18 @@
 # app/crud/renewal.py
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session, aliased, contains_eager
+from sqlalchemy import and_, or_, func, select
 from app.models.renewal import RenewalInfo, DealRenewalJunction, DealRenewalRelationship
 from app.models.deal import Deal as DealModel
+from app.models.merchant import Merchant as MerchantModel
 from app.models.offer import Offer as OfferModel
+from app.database import list_load_options
 from app.schemas.renewal import (
     RenewalInfoCreate, RenewalInfoUpdate,
     DealRenewalJunctionCreate, DealRenewalRelationshipCreate,
     CreateRenewalDeal, RenewalSummary, RenewalChain
 )
-from app.crud.deal import generate_deal_number, calculate_maturity_date
-from typing import List, Optional
+from app.crud.deal import generate_deal_number, calculate_maturity_date, DealCreateContext
+from typing import Dict, List, NamedTuple, Optional
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -29,10 +31,59 @@ def create_renewal_info(db: Session, renewal_info: RenewalInfoCreate) -> Renewal
     return db_renewal_info
 
 
-def create_renewal_deal(db: Session, renewal_data: CreateRenewalDeal) -> DealModel:
-    """Create a complete renewal deal with all relationships"""
+class RenewalCreateContext(NamedTuple):
+    """Validation state of the merchant, offer and old deals referenced by a renewal"""
+    deal_context: DealCreateContext
+    old_deals: Dict[int, DealModel]
+
+
+def load_renewal_context(
+        db: Session,
+        merchant_id: int,
+        offer_id: int,
+        old_deal_ids: List[int]
+) -> RenewalCreateContext:
+    """Load merchant, offer and old-deal validation state for a renewal in a single query"""
+    # One row per matching old deal (or one row with no deal), each carrying the merchant and offer
+    rows = db.query(MerchantModel.id, OfferModel, DealModel).select_from(MerchantModel).outerjoin(
+        OfferModel,
+        and_(
+            OfferModel.id == offer_id,
+            OfferModel.is_deleted == False
+        )
+    ).outerjoin(
+        DealModel,
+        DealModel.id.in_(old_deal_ids)
+    ).filter(
+        and_(
+            MerchantModel.id == merchant_id,
+            MerchantModel.is_deleted == False
+        )
+    ).all()
+
+    if not rows:
+        return RenewalCreateContext(DealCreateContext(False, False, None, False, None), {})
+
+    old_deals = {deal.id: deal for _, _, deal in rows if deal is not None}
+    offer = rows[0][1]
+    if offer is None:
+        return RenewalCreateContext(DealCreateContext(True, False, None, False, None), old_deals)
+
+    return RenewalCreateContext(
+        DealCreateContext(True, True, offer.status, offer.merchant_id == merchant_id, offer),
+        old_deals
+    )
+
+
+def create_renewal_deal(
+        db: Session,
+        renewal_data: CreateRenewalDeal,
+        offer: Optional[OfferModel] = None
+) -> DealModel:
+    """Create a complete renewal deal with all relationships (pass the already-loaded offer to skip the lookup)"""
     # Get offer details
-    offer = db.query(OfferModel).filter(OfferModel.id == renewal_data.offer_id).first()
+    if offer is None:
+        offer = db.query(OfferModel).filter(OfferModel.id == renewal_data.offer_id).first()
     if not offer:
         raise ValueError("Offer not found")
 
@@ -130,6 +181,30 @@ def create_renewal_deal(db: Session, renewal_data: CreateRenewalDeal) -> DealMod
     return db_deal
 
 
+def get_renewal_info(db: Session, renewal_info_id: int) -> Optional[RenewalInfo]:
+    """Get a renewal info record by ID (served from the identity map when already loaded)"""
+    return db.get(RenewalInfo, renewal_info_id)
+
+
+def get_relationships(
+        db: Session,
+        old_deal_id: Optional[int] = None,
+        new_deal_id: Optional[int] = None,
+        status: Optional[str] = None
+) -> List[DealRenewalRelationship]:
+    """Get renewal relationships with optional filtering"""
+    stmt = select(DealRenewalRelationship).options(*list_load_options())
+
+    if old_deal_id:
+        stmt = stmt.where(DealRenewalRelationship.old_deal_id == old_deal_id)
+    if new_deal_id:
+        stmt = stmt.where(DealRenewalRelationship.new_deal_id == new_deal_id)
+    if status:
+        stmt = stmt.where(DealRenewalRelationship.status == status)
+
+    return db.scalars(stmt).all()
+
+
 def get_renewal_info_by_deal(db: Session, deal_id: int) -> List[RenewalInfo]:
     """Get all renewal info records for a renewal deal"""
     return db.query(RenewalInfo).join(
@@ -141,58 +216,88 @@ def get_renewal_info_by_deal(db: Session, deal_id: int) -> List[RenewalInfo]:
 
 def get_deals_renewed_by(db: Session, renewal_deal_id: int) -> List[dict]:
     """Get all old deals that were renewed by a specific renewal deal"""
-    relationships = db.query(DealRenewalRelationship).filter(
+    # Old deal and renewal info are joined in and populated from the same row (no per-relationship queries)
+    relationships = db.query(DealRenewalRelationship).join(
+        DealRenewalRelationship.old_deal
+    ).join(
+        DealRenewalRelationship.renewal_info
+    ).options(
+        contains_eager(DealRenewalRelationship.old_deal),
+        contains_eager(DealRenewalRelationship.renewal_info)
+    ).filter(
         and_(
             DealRenewalRelationship.new_deal_id == renewal_deal_id,
             DealRenewalRelationship.status == "active"
         )
     ).all()
 
-    results = []
-    for rel in relationships:
-        old_deal = db.query(DealModel).filter(DealModel.id == rel.old_deal_id).first()
-        renewal_info = db.query(RenewalInfo).filter(RenewalInfo.id == rel.renewal_info_id).first()
-
-        if old_deal and renewal_info:
-            results.append({
-                "deal_id": old_deal.id,
-                "deal_number": old_deal.deal_number,
-                "transfer_balance": float(renewal_info.transfer_balance),
-                "payoff_date": renewal_info.payoff_date
-            })
-
-    return results
+    return [
+        {
+            "deal_id": rel.old_deal.id,
+            "deal_number": rel.old_deal.deal_number,
+            "transfer_balance": float(rel.renewal_info.transfer_balance),
+            "payoff_date": rel.renewal_info.payoff_date
+        }
+        for rel in relationships
+    ]
 
 
 def get_renewal_deal_for(db: Session, old_deal_id: int) -> Optional[dict]:
     """Check if an old deal was renewed and get the renewal deal info"""
-    relationship = db.query(DealRenewalRelationship).filter(
+    # Relationship and renewal deal in one joined query
+    new_deal = db.query(DealModel.id, DealModel.deal_number, DealModel.funding_date).join(
+        DealRenewalRelationship,
+        DealRenewalRelationship.new_deal_id == DealModel.id
+    ).filter(
         and_(
             DealRenewalRelationship.old_deal_id == old_deal_id,
             DealRenewalRelationship.status == "active"
         )
     ).first()
 
-    if relationship:
-        new_deal = db.query(DealModel).filter(DealModel.id == relationship.new_deal_id).first()
-        if new_deal:
-            return {
-                "deal_id": new_deal.id,
-                "deal_number": new_deal.deal_number,
-                "renewal_date": new_deal.funding_date
-            }
+    if new_deal:
+        return {
+            "deal_id": new_deal.id,
+            "deal_number": new_deal.deal_number,
+            "renewal_date": new_deal.funding_date
+        }
 
     return None
 
 
 def get_renewal_chain(db: Session, deal_id: int) -> RenewalChain:
     """Get the complete renewal chain for a deal"""
-    deal = db.query(DealModel).filter(DealModel.id == deal_id).first()
-    if not deal:
+    # The deal and the deal it was renewed into (if any) come back in one outer-joined row
+    new_deal = aliased(DealModel)
+    row = db.query(
+        DealModel,
+        new_deal.id.label("renewed_into_id"),
+        new_deal.deal_number.label("renewed_into_number"),
+        new_deal.funding_date.label("renewed_into_date")
+    ).outerjoin(
+        DealRenewalRelationship,
+        and_(
+            DealRenewalRelationship.old_deal_id == DealModel.id,
+            DealRenewalRelationship.status == "active"
+        )
+    ).outerjoin(
+        new_deal,
+        new_deal.id == DealRenewalRelationship.new_deal_id
+    ).filter(DealModel.id == deal_id).first()
+
+    if not row:
         raise ValueError("Deal not found")
 
+    deal = row.Deal
+
     # Check if this deal was renewed
-    renewed_into = get_renewal_deal_for(db, deal_id)
+    renewed_into = None
+    if row.renewed_into_id is not None:
+        renewed_into = {
+            "deal_id": row.renewed_into_id,
+            "deal_number": row.renewed_into_number,
+            "renewal_date": row.renewed_into_date
+        }
 
     # Check if this deal is a renewal
     renewed_from = []
@@ -1,20 +1,58 @@
 # app/database.py
+import os
+import anyio.to_thread
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, Session, raiseload
 
 # Database URL - using SQLite for development
 SQLALCHEMY_DATABASE_URL = "sqlite:///./mca_crm.db"
 
+# Same database through an async driver (aiosqlite here, postgresql+asyncpg in production)
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./mca_crm.db"
+
+# Connection pool sizing - sync routes each hold one connection from a worker thread
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 10
+
+# Recycle connections before server-side idle timeouts close them (seconds)
+DB_POOL_RECYCLE = 3600
+
+# Worker threads for sync (def) routes - above the pool size so requests queue on the pool, not the loop
+THREADPOOL_LIMIT = 100
+
+# Make list queries raise on any lazy relationship load - set SQLALCHEMY_RAISELOAD=1 in staging/CI
+RAISELOAD_ENABLED = os.getenv("SQLALCHEMY_RAISELOAD") == "1"
+
 # Create engine
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Only needed for SQLite
+    connect_args={"check_same_thread": False},  # Only needed for SQLite
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,  # Replace dead connections on checkout instead of failing the request
+    pool_recycle=DB_POOL_RECYCLE
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async engine - aiosqlite always uses NullPool, so pool sizing only applies to server databases
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE
+)
+
+# Create AsyncSessionLocal class - objects stay loaded after commit so responses never lazy-load
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create Base class
 Base = declarative_base()
 
@@ -32,6 +70,27 @@ def get_db() -> Session:
         db.close()
 
 
+# Async dependency function to get database session
+async def get_async_db() -> AsyncSession:
+    """
+    Async database dependency function.
+    Creates a new async session for each request and closes it when done.
+    Sync CRUD functions can be run against it with `await db.run_sync(fn, ...)`.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Loader options for list queries
+def list_load_options() -> tuple:
+    """
+    Loader options appended to list queries whose response models only read columns.
+    With SQLALCHEMY_RAISELOAD=1 this is raiseload("*"), so a schema change that starts
+    touching a relationship fails in CI instead of quietly adding a SELECT per row.
+    """
+    return (raiseload("*"),) if RAISELOAD_ENABLED else ()
+
+
 # Initialize database function
 def init_db():
     """
@@ -41,4 +100,15 @@ def init_db():
     from app.models import merchant, offer, principal
 
     # Create all tables
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+
+
+# Threadpool sizing function
+async def configure_threadpool(limit: int = THREADPOOL_LIMIT):
+    """
+    Raise the anyio worker thread limit used for sync route handlers (call from the app
+    lifespan, next to init_cache). The sync routes run their blocking Session calls in
+    this pool, which defaults to 40 threads. The limiter belongs to the running event
+    loop, hence async: it can only be set from inside the loop that serves requests.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = limit
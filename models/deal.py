@@ -1,5 +1,5 @@
 # app/models/deal.py
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, Boolean, ForeignKey, Text, Date
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Boolean, ForeignKey, Text, Date, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -68,4 +68,15 @@ class Deal(Base):
 
     is_deleted = Column(Boolean, default=False, nullable=False)
     deleted_at = Column(DateTime, nullable=True)
-    deleted_by = Column(String(100), nullable=True)
\ No newline at end of file
+    deleted_by = Column(String(100), nullable=True)
+
+    # Composite indexes matching the DealFilter WHERE clauses used by the deal list endpoint
+    __table_args__ = (
+        Index("ix_deals_merchant_status_funddate", "merchant_id", "status", "funding_date"),
+        Index("ix_deals_status_funddate", "status", "funding_date"),
+        Index(
+            "ix_deals_merchant_isrenewal", "merchant_id",
+            postgresql_where=text("is_renewal = true"),
+            sqlite_where=text("is_renewal = 1")
+        ),
+    )
@@ -1,5 +1,5 @@
 # app/models/offer.py
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, CheckConstraint, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -47,4 +47,11 @@ class Offer(Base):
 
     # Relationships
     merchant = relationship("Merchant", back_populates="offers")
-    deal = relationship("Deal", back_populates="offer", uselist=False)  # One-to-one relationship
\ No newline at end of file
+    deal = relationship("Deal", back_populates="offer", uselist=False)  # One-to-one relationship
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('draft', 'sent', 'selected', 'funded')",
+            name="ck_offers_status"
+        ),
+    )
\ No newline at end of file
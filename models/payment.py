@@ -1,5 +1,5 @@
 # app/models/payment.py
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -29,4 +29,9 @@ class Payment(Base):
 
     is_deleted = Column(Boolean, default=False, nullable=False)
     deleted_at = Column(DateTime, nullable=True)
-    deleted_by = Column(String(100), nullable=True)
\ No newline at end of file
+    deleted_by = Column(String(100), nullable=True)
+
+    __table_args__ = (
+        # Keyset pagination seeks on (date, id)
+        Index("ix_payments_date_id", "date", "id"),
+    )
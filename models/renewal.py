@@ -1,5 +1,5 @@
 # app/models/renewal.py
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, Boolean, ForeignKey, Date, Text
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Boolean, ForeignKey, Date, Text, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -28,6 +28,15 @@ class RenewalInfo(Base):
     deal_renewal_junctions = relationship("DealRenewalJunction", back_populates="renewal_info")
     renewal_relationships = relationship("DealRenewalRelationship", back_populates="renewal_info")
 
+    # Partial index - renewal lookups by old deal only care about payoffs still outstanding
+    __table_args__ = (
+        Index(
+            "ix_renewal_info_old_deal_active", "old_deal_id",
+            postgresql_where=text("payoff_date IS NULL"),
+            sqlite_where=text("payoff_date IS NULL")
+        ),
+    )
+
 
 class DealRenewalJunction(Base):
     """Links new renewal deals to their renewal_info records"""
@@ -77,4 +86,13 @@ class DealRenewalRelationship(Base):
     # Relationships
     old_deal = relationship("Deal", foreign_keys=[old_deal_id], backref="renewed_to_relationships")
     new_deal = relationship("Deal", foreign_keys=[new_deal_id], backref="renewed_from_relationships")
-    renewal_info = relationship("RenewalInfo", back_populates="renewal_relationships")
\ No newline at end of file
+    renewal_info = relationship("RenewalInfo", back_populates="renewal_relationships")
+
+    # Partial index - soft-deleted relationships are never looked up
+    __table_args__ = (
+        Index(
+            "ix_renewal_rel_old_new", "old_deal_id", "new_deal_id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0")
+        ),
+    )
\ No newline at end of file
@@ -1,5 +1,6 @@
 # app/routes/banking.py
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db  # Fixed import
@@ -14,7 +15,8 @@ from app.crud.merchant import get_merchant  # Fixed import
 
 router = APIRouter(
     prefix="/merchants/{merchant_id}/banking",
-    tags=["banking"]
+    tags=["banking"],
+    default_response_class=ORJSONResponse
 )
 
 @router.post("/", response_model=BankAccountResponse)
@@ -44,21 +46,19 @@ def get_merchant_bank_accounts(
         db: Session = Depends(get_db)
 ):
     """Get all bank accounts for a merchant"""
-    merchant = get_merchant.get(db, merchant_id)
+    merchant = get_merchant(db, merchant_id)
     if not merchant:
         raise HTTPException(status_code=404, detail="Merchant not found")
 
-    bank_accounts = crud_bank_account.get_by_merchant(
+    rows = crud_bank_account.get_rows_by_merchant(
         db, merchant_id, skip, limit, active_only
     )
 
-    response = []
-    for account in bank_accounts:
-        account_response = BankAccountResponse.from_orm(account)
-        account_response.merchant_name = merchant.name
-        response.append(account_response)
-
-    return response
+    # Rows come straight from the column select, so skip re-validation
+    return [
+        BankAccountResponse.model_construct(**row, merchant_name=merchant.company_name)
+        for row in rows
+    ]
 
 
 @router.get("/{bank_account_id}", response_model=BankAccountResponse)
@@ -134,7 +134,8 @@ def set_primary_bank_account(
 # Alternative routing structure - direct access
 router_direct = APIRouter(
     prefix="/banking",
-    tags=["banking"]
+    tags=["banking"],
+    default_response_class=ORJSONResponse
 )
 
 
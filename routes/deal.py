@@ -1,20 +1,22 @@
 # app/routes/deal.py
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
+from decimal import Decimal
 
 from app.database import get_db
 from app.schemas.deal import (
-    Deal, DealCreate, DealUpdate, DealFilter, DealSummary
+    Deal, DealCreate, DealUpdate, DealFilter, DealSummary, DealWithPaymentColumns, DealStatusValue
 )
 from app.crud import deal as crud
 from app.crud import merchant as merchant_crud
-from app.crud import offer as offer_crud
 
 router = APIRouter(
     prefix="/api/v1/deals",
-    tags=["deals"]
+    tags=["deals"],
+    default_response_class=ORJSONResponse
 )
 
 
@@ -24,22 +26,19 @@ def create_deal(
         db: Session = Depends(get_db)
 ):
     """Create a new deal from an accepted offer"""
-    # Verify merchant exists
-    merchant = merchant_crud.get_merchant(db, deal.merchant_id)
-    if not merchant:
+    # Verify merchant exists and offer exists, belongs to merchant and is selected (one query)
+    context = crud.load_create_context(db, deal.merchant_id, deal.offer_id)
+    if not context.merchant_exists:
         raise HTTPException(status_code=404, detail="Merchant not found")
-
-    # Verify offer exists and belongs to merchant
-    offer = offer_crud.get_offer(db, deal.offer_id)
-    if not offer:
+    if not context.offer_exists:
         raise HTTPException(status_code=404, detail="Offer not found")
-    if offer.merchant_id != deal.merchant_id:
+    if not context.offer_belongs:
         raise HTTPException(status_code=400, detail="Offer does not belong to merchant")
-    if offer.status != "selected":
+    if context.offer_status != "selected":
         raise HTTPException(status_code=400, detail="Offer must be in 'selected' status")
 
     try:
-        return crud.create_deal(db=db, deal=deal)
+        return crud.create_deal(db=db, deal=deal, offer=context.offer)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -49,11 +48,11 @@ def list_deals(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
         merchant_id: Optional[int] = None,
-        status: Optional[str] = None,
+        status: Optional[DealStatusValue] = None,
         funding_date_from: Optional[date] = None,
         funding_date_to: Optional[date] = None,
-        min_amount: Optional[float] = None,
-        max_amount: Optional[float] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
         in_collections: Optional[bool] = None,
         db: Session = Depends(get_db)
 ):
@@ -67,13 +66,13 @@ def list_deals(
         max_amount=max_amount,
         in_collections=in_collections
     )
-    return crud.get_deals(db=db, skip=skip, limit=limit, filters=filters)
+    return crud.get_deal_rows(db=db, skip=skip, limit=limit, filters=filters)
 
 
 @router.get("/active", response_model=List[Deal])
 def get_active_deals(db: Session = Depends(get_db)):
     """Get all active deals"""
-    return crud.get_active_deals(db=db)
+    return crud.get_active_deal_rows(db=db)
 
 
 @router.get("/summary", response_model=DealSummary)
@@ -94,6 +93,19 @@ def get_deal(
     return deal
 
 
+@router.get("/{deal_id}/payment-columns", response_model=DealWithPaymentColumns)
+def get_deal_with_payment_columns(
+        deal_id: int,
+        include_deleted: bool = False,
+        db: Session = Depends(get_db)
+):
+    """Get a deal with its payment history as parallel arrays (compact for long histories)"""
+    deal = crud.get_deal_with_payment_columns(db=db, deal_id=deal_id, include_deleted=include_deleted)
+    if not deal:
+        raise HTTPException(status_code=404, detail="Deal not found")
+    return deal
+
+
 @router.get("/number/{deal_number}", response_model=Deal)
 def get_deal_by_number(
         deal_number: str,
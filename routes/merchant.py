@@ -1,18 +1,31 @@
 # app/routes/merchant.py - Updated for soft deletes
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.schemas.merchant import (
-    Merchant, MerchantCreate, MerchantUpdate, MerchantListResponse
+    Merchant, MerchantCreate, MerchantUpdate, MerchantListResponse,
+    MerchantStatus, MerchantSortField, SortOrder, VALIDATION_DATE
 )
 from app.crud import merchant as merchant_crud
 from app.crud.merchant import MerchantCRUDError  # Removed DuplicateFEINError
+from app.cache import etag_matches, rows_etag
 from app.database import get_db
 from typing import List, Optional
+from datetime import date
 import logging
 
+
+async def pin_validation_date():
+    """Fix "today" for the request before its body is validated"""
+    # async so the ContextVar is set in the request's own context, not a threadpool copy
+    VALIDATION_DATE.set(date.today())
+
+
 router = APIRouter(
     prefix="/api/v1",
-    tags=["merchants"]
+    tags=["merchants"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(pin_validation_date)]
 )
 
 logger = logging.getLogger(__name__)
@@ -42,30 +55,43 @@ def create_merchant(
 
 @router.get("/merchants/", response_model=MerchantListResponse)
 def read_merchants(
+        request: Request,
+        response: Response,
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-        status: Optional[str] = Query(None, regex="^(lead|prospect|applicant|approved|declined|funded|closed)$"),
+        status: Optional[MerchantStatus] = Query(None),
         search: Optional[str] = Query(None, min_length=1, max_length=100, description="Search term"),
-        sort_by: str = Query("created_at", regex="^(company_name|status|created_at|updated_at)$"),
-        sort_order: str = Query("desc", regex="^(asc|desc)$"),
+        sort_by: MerchantSortField = Query(MerchantSortField.CREATED_AT),
+        sort_order: SortOrder = Query(SortOrder.DESC),
         db: Session = Depends(get_db)
 ):
-    """Get merchants with pagination, filtering, and sorting"""
+    """
+    Get merchants with pagination, filtering, and sorting
+
+    Supports conditional GET: polling clients that send back the ETag in
+    If-None-Match get a 304 (no serialization, no body) while the page is unchanged.
+    """
     try:
-        merchants = merchant_crud.get_merchants(
+        status_value = status.value if status else None
+        merchants, total = merchant_crud.get_merchants_with_total(
             db,
             skip=skip,
             limit=limit,
-            status=status,
+            status=status_value,
             search=search,
-            sort_by=sort_by,
-            sort_order=sort_order
+            sort_by=sort_by.value,
+            sort_order=sort_order.value
         )
 
-        total = merchant_crud.count_merchants(db, status=status, search=search)
+        # Built from the rows' column values: updated_at alone has one-second resolution
+        # on SQLite, so an edit in the same second as the last read would keep the old ETag
+        etag = rows_etag(merchants, total, skip, limit)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
 
         return MerchantListResponse(
-            merchants=merchants,
+            merchants=Merchant.model_validate_many(merchants),
             total=total,
             page=skip // limit + 1,
             per_page=limit
@@ -152,12 +178,12 @@ def update_merchant(
 @router.patch("/merchants/{merchant_id}/status", response_model=Merchant)
 def update_merchant_status(
         merchant_id: int,
-        status: str = Query(..., regex="^(lead|prospect|applicant|approved|declined|funded|closed)$"),
+        status: MerchantStatus = Query(...),
         db: Session = Depends(get_db)
 ):
     """Update only the merchant status"""
     try:
-        merchant_update = MerchantUpdate(status=status)
+        merchant_update = MerchantUpdate(status=status.value)
         merchant = merchant_crud.update_merchant(
             db,
             merchant_id=merchant_id,
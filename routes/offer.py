@@ -1,85 +1,95 @@
 # app/routes/offer.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.schemas.offer import Offer, OfferCreate, OfferUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import from_orm_fast
+from app.schemas.offer import Offer, OfferCreate, OfferPage, OfferUpdate
 from app.crud import offer as offer_crud
-from app.database import SessionLocal
-from typing import List
+from app.cache import etag_matches, resource_etag
+from app.database import get_async_db
+from app.streaming import stream_json_list
+from typing import List, Optional
 
-router = APIRouter()
-
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/offers/", response_model=Offer)
-def create_offer(offer: OfferCreate, db: Session = Depends(get_db)):
+async def create_offer(offer: OfferCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new offer for a merchant"""
-    return offer_crud.create_offer(db, offer)
+    return await db.run_sync(offer_crud.create_offer, offer)
 
 
-@router.get("/offers/", response_model=List[Offer])
-def read_offers(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all offers with pagination"""
-    return offer_crud.get_offers(db, skip=skip, limit=limit)
+@router.get("/offers/", response_model=OfferPage)
+async def read_offers(
+        cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
+        limit: int = Query(100, ge=1, le=1000),
+        db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of offers, newest first"""
+    offers, next_cursor = await db.run_sync(offer_crud.get_offers, cursor=cursor, limit=limit)
+    return OfferPage(data=[from_orm_fast(Offer, offer) for offer in offers], next_cursor=next_cursor)
 
 
 @router.get("/offers/{offer_id}", response_model=Offer)
-def read_offer(offer_id: int, db: Session = Depends(get_db)):
-    """Get a specific offer by ID"""
-    db_offer = offer_crud.get_offer(db, offer_id=offer_id)
+async def read_offer(
+        offer_id: int,
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific offer by ID (supports If-None-Match)"""
+    db_offer = await db.run_sync(offer_crud.get_offer, offer_id=offer_id)
     if db_offer is None:
         raise HTTPException(status_code=404, detail="Offer not found")
+
+    etag = resource_etag(db_offer)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return db_offer
 
 
 @router.get("/merchants/{merchant_id}/offers/", response_model=List[Offer])
-def read_merchant_offers(merchant_id: int, db: Session = Depends(get_db)):
-    """Get all offers for a specific merchant"""
-    return offer_crud.get_offers_by_merchant(db, merchant_id=merchant_id)
+async def read_merchant_offers(merchant_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Get all offers for a specific merchant (streamed)"""
+    return await stream_json_list(db, offer_crud.offers_by_merchant_stmt(merchant_id), Offer)
 
 
 @router.get("/merchants/{merchant_id}/offers/selected", response_model=Offer)
-def read_selected_offer(merchant_id: int, db: Session = Depends(get_db)):
+async def read_selected_offer(merchant_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get the selected offer for a merchant"""
-    db_offer = offer_crud.get_selected_offer_by_merchant(db, merchant_id=merchant_id)
+    db_offer = await db.run_sync(offer_crud.get_selected_offer_by_merchant, merchant_id=merchant_id)
     if db_offer is None:
         raise HTTPException(status_code=404, detail="No selected offer found for this merchant")
     return db_offer
 
 
 @router.put("/offers/{offer_id}", response_model=Offer)
-def update_offer(offer_id: int, offer_update: OfferUpdate, db: Session = Depends(get_db)):
+async def update_offer(offer_id: int, offer_update: OfferUpdate, db: AsyncSession = Depends(get_async_db)):
     """Update an existing offer"""
-    db_offer = offer_crud.update_offer(db, offer_id=offer_id, offer_update=offer_update)
+    db_offer = await db.run_sync(offer_crud.update_offer, offer_id=offer_id, offer_update=offer_update)
     if db_offer is None:
         raise HTTPException(status_code=404, detail="Offer not found")
     return db_offer
 
 
 @router.patch("/offers/{offer_id}/status/{status}")
-def update_offer_status(offer_id: int, status: str, db: Session = Depends(get_db)):
+async def update_offer_status(offer_id: int, status: str, db: AsyncSession = Depends(get_async_db)):
     """Update offer status (draft, sent, selected, funded)"""
     valid_statuses = ["draft", "sent", "selected", "funded"]
     if status not in valid_statuses:
         raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
 
-    offer_update = OfferUpdate(status=status)
-    db_offer = offer_crud.update_offer(db, offer_id=offer_id, offer_update=offer_update)
+    db_offer = await db.run_sync(offer_crud.set_status, offer_id=offer_id, status=status)
     if db_offer is None:
         raise HTTPException(status_code=404, detail="Offer not found")
     return {"message": f"Offer status updated to {status}", "offer_id": offer_id}
 
 
 @router.delete("/offers/{offer_id}")
-def delete_offer(offer_id: int, db: Session = Depends(get_db)):
+async def delete_offer(offer_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete an offer"""
-    db_offer = offer_crud.delete_offer(db, offer_id=offer_id)
+    db_offer = await db.run_sync(offer_crud.delete_offer, offer_id=offer_id)
     if db_offer is None:
         raise HTTPException(status_code=404, detail="Offer not found")
-    return {"message": "Offer deleted successfully"}
\ No newline at end of file
+    return {"message": "Offer deleted successfully"}
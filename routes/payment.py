@@ -1,47 +1,77 @@
 # app/routes/payment.py
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 
-from app.database import get_db
+from app.cache import (
+    CACHE_TTL_LONG, CACHE_TTL_NORMAL, CACHE_TTL_SHORT, cache_with_stale_fallback,
+    PAYMENTS_NAMESPACE, etag_matches, invalidate_cache, resource_etag
+)
+from app.database import get_async_db
+from app.streaming import stream_json_list
+from app.schemas import from_orm_fast
 from app.schemas.payment import (
     Payment, PaymentCreate, PaymentUpdate, PaymentFilter,
-    PaymentSummary, PaymentType
+    PaymentPage, PaymentSummary, PaymentTypeStat, PaymentTypeValue, VALIDATION_NOW
 )
 from app.crud import payment as crud
 
+
+async def pin_validation_now():
+    """Fix "now" for the request before its body is validated"""
+    # async so the ContextVar is set in the request's own context, not a threadpool copy
+    VALIDATION_NOW.set(datetime.now())
+
+
 router = APIRouter(
     prefix="/api/v1/payments",
-    tags=["payments"]
+    tags=["payments"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(pin_validation_now)]
 )
 
 
 @router.post("/", response_model=Payment, status_code=201)
-def create_payment(
+async def create_payment(
     payment: PaymentCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new payment record"""
     # TODO: Verify deal_id exists when Deal model is created
-    return crud.create_payment(db=db, payment=payment)
+    db_payment = await db.run_sync(crud.create_payment, payment=payment)
+    await invalidate_cache(PAYMENTS_NAMESPACE)
+    return db_payment
+
+
+@router.post("/bulk", response_model=List[Payment], status_code=201)
+async def create_payments_bulk(
+    payments: List[PaymentCreate] = Body(..., min_length=1, max_length=1000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create several payment records in one request and one transaction"""
+    db_payments = await db.run_sync(crud.create_payments_bulk, payments=payments)
+    await invalidate_cache(PAYMENTS_NAMESPACE)
+    return [from_orm_fast(Payment, payment) for payment in db_payments]
 
 
-@router.get("/", response_model=List[Payment])
-def list_payments(
-    skip: int = Query(0, ge=0),
+@router.get("/", response_model=PaymentPage)
+async def list_payments(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(100, ge=1, le=1000),
     deal_id: Optional[int] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
-    type: Optional[PaymentType] = None,
+    type: Optional[PaymentTypeValue] = None,
     bounced: Optional[bool] = None,
     min_amount: Optional[Decimal] = None,
     max_amount: Optional[Decimal] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get list of payments with optional filtering"""
+    """Get a page of payments with optional filtering"""
     filters = PaymentFilter(
         deal_id=deal_id,
         date_from=date_from,
@@ -51,116 +81,155 @@ def list_payments(
         min_amount=min_amount,
         max_amount=max_amount
     )
-    return crud.get_payments(db=db, skip=skip, limit=limit, filters=filters)
+    try:
+        payments, next_cursor = await db.run_sync(
+            crud.get_payments, cursor=cursor, limit=limit, filters=filters
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return PaymentPage(data=[from_orm_fast(Payment, payment) for payment in payments], next_cursor=next_cursor)
 
 
 @router.get("/recent", response_model=List[Payment])
-def get_recent_payments(
+@cache(expire=CACHE_TTL_SHORT, namespace=PAYMENTS_NAMESPACE)
+async def get_recent_payments(
     days: int = Query(7, ge=1, le=90),
     limit: int = Query(50, ge=1, le=200),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get recent payments within specified number of days"""
-    return crud.get_recent_payments(db=db, days=days, limit=limit)
+    payments = await db.run_sync(crud.get_recent_payments, days=days, limit=limit)
+    # Cached as JSON, so hand back schemas rather than ORM rows
+    return [from_orm_fast(Payment, payment) for payment in payments]
+
+
+@router.get("/export", response_model=List[Payment])
+async def export_payments(
+    deal_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    type: Optional[PaymentTypeValue] = None,
+    bounced: Optional[bool] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Stream every payment matching the filters as one JSON array (no page limit)"""
+    filters = PaymentFilter(
+        deal_id=deal_id,
+        date_from=date_from,
+        date_to=date_to,
+        type=type,
+        bounced=bounced,
+        min_amount=min_amount,
+        max_amount=max_amount
+    )
+    return await stream_json_list(db, crud.payments_export_stmt(filters=filters), Payment)
 
 
 @router.get("/bounced", response_model=List[Payment])
-def get_bounced_payments(
+async def get_bounced_payments(
     deal_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all bounced payments"""
-    return crud.get_bounced_payments(db=db, deal_id=deal_id)
+    payments = await db.run_sync(crud.get_bounced_payments, deal_id=deal_id)
+    return [from_orm_fast(Payment, payment) for payment in payments]
 
 
-@router.get("/stats/by-type")
-def get_payment_stats_by_type(
+@router.get("/stats/by-type", response_model=List[PaymentTypeStat])
+@cache(expire=CACHE_TTL_LONG, namespace=PAYMENTS_NAMESPACE)
+async def get_payment_stats_by_type(
     deal_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get payment statistics grouped by payment type"""
-    stats = crud.get_payment_stats_by_type(db=db, deal_id=deal_id)
-    return [
-        {
-            "type": stat.type,
-            "count": stat.count,
-            "total_amount": float(stat.total_amount) if stat.total_amount else 0,
-            "avg_amount": float(stat.avg_amount) if stat.avg_amount else 0
-        }
-        for stat in stats
-    ]
+    return await db.run_sync(crud.get_payment_stats_by_type, deal_id=deal_id)
 
 
 @router.get("/{payment_id}", response_model=Payment)
-def get_payment(
+async def get_payment(
     payment_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get a specific payment by ID"""
-    payment = crud.get_payment(db=db, payment_id=payment_id)
+    """Get a specific payment by ID (supports If-None-Match)"""
+    payment = await db.run_sync(crud.get_payment, payment_id=payment_id)
     if not payment:
         raise HTTPException(status_code=404, detail="Payment not found")
+
+    etag = resource_etag(payment)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return payment
 
 
 @router.put("/{payment_id}", response_model=Payment)
-def update_payment(
+async def update_payment(
     payment_id: int,
     payment_update: PaymentUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a payment record"""
-    payment = crud.update_payment(db=db, payment_id=payment_id, payment_update=payment_update)
+    payment = await db.run_sync(crud.update_payment, payment_id=payment_id, payment_update=payment_update)
     if not payment:
         raise HTTPException(status_code=404, detail="Payment not found")
+    await invalidate_cache(PAYMENTS_NAMESPACE)
     return payment
 
 
 @router.patch("/{payment_id}/bounce", response_model=Payment)
-def mark_payment_bounced(
+async def mark_payment_bounced(
     payment_id: int,
     bounced: bool = True,
     notes: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Mark a payment as bounced or unbounced"""
-    payment = crud.mark_payment_bounced(
-        db=db,
+    payment = await db.run_sync(
+        crud.mark_payment_bounced,
         payment_id=payment_id,
         bounced=bounced,
         notes=notes
     )
     if not payment:
         raise HTTPException(status_code=404, detail="Payment not found")
+    await invalidate_cache(PAYMENTS_NAMESPACE)
     return payment
 
 
 @router.delete("/{payment_id}", status_code=204)
-def delete_payment(
+async def delete_payment(
     payment_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a payment record"""
-    if not crud.delete_payment(db=db, payment_id=payment_id):
+    if not await db.run_sync(crud.delete_payment, payment_id=payment_id):
         raise HTTPException(status_code=404, detail="Payment not found")
+    await invalidate_cache(PAYMENTS_NAMESPACE)
 
 
 # Deal-specific endpoints
 @router.get("/deals/{deal_id}/payments", response_model=List[Payment])
-def get_payments_by_deal(
+async def get_payments_by_deal(
     deal_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all payments for a specific deal"""
+    """Get all payments for a specific deal (streamed)"""
     # TODO: Verify deal_id exists when Deal model is created
-    return crud.get_payments_by_deal(db=db, deal_id=deal_id)
+    return await stream_json_list(db, crud.payments_by_deal_stmt(deal_id), Payment)
 
 
 @router.get("/deals/{deal_id}/summary", response_model=PaymentSummary)
-def get_payment_summary_by_deal(
+@cache_with_stale_fallback(expire=CACHE_TTL_NORMAL, namespace=PAYMENTS_NAMESPACE)
+async def get_payment_summary_by_deal(
     deal_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get payment summary statistics for a deal"""
     # TODO: Verify deal_id exists when Deal model is created
-    return crud.get_payment_summary_by_deal(db=db, deal_id=deal_id)
\ No newline at end of file
+    return await db.run_sync(crud.get_payment_summary_by_deal, deal_id=deal_id)
\ No newline at end of file
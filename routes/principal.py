@@ -1,6 +1,9 @@
 # app/routes/principal.py
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import from_orm_fast
 from app.schemas.principal import (
     Principal, PrincipalCreate, PrincipalUpdate, PrincipalListResponse
 )
@@ -8,13 +11,17 @@ from app.crud import principal as principal_crud
 from app.crud.principal import (
     DuplicateSSNError, OwnershipExceededError, PrincipalCRUDError
 )
-from app.database import get_db
+from app.cache import (
+    CACHE_TTL_NORMAL, PRINCIPALS_NAMESPACE, etag_matches, invalidate_cache, resource_etag
+)
+from app.database import get_async_db
 from typing import List, Optional
 import logging
 
 router = APIRouter(
     prefix="/api/v1",
-    tags=["principals"]
+    tags=["principals"],
+    default_response_class=ORJSONResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -23,10 +30,10 @@ logger = logging.getLogger(__name__)
 # Add this to your routes/principal.py file
 
 @router.get("/principals/", response_model=List[Principal])
-def get_all_principals(
+async def get_all_principals(
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(1000, ge=1, le=10000, description="Maximum number of records to return"),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all active principals across all merchants
@@ -35,8 +42,9 @@ def get_all_principals(
     - **limit**: Maximum records to return
     """
     try:
-        principals = principal_crud.get_all_principals(db, skip=skip, limit=limit)
-        return principals
+        principals = await db.run_sync(principal_crud.get_all_principals, skip=skip, limit=limit)
+        # Rows from the database were validated on the way in; skip re-running the validators
+        return [from_orm_fast(Principal, principal) for principal in principals]
     except PrincipalCRUDError as e:
         logger.error(f"Error fetching all principals: {str(e)}")
         raise HTTPException(
@@ -45,9 +53,9 @@ def get_all_principals(
         )
 
 @router.post("/principals/", response_model=Principal, status_code=status.HTTP_201_CREATED)
-def create_principal(
+async def create_principal(
         principal: PrincipalCreate,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new principal for a merchant
@@ -58,7 +66,7 @@ def create_principal(
     - **is_primary_contact**: Only one principal can be primary per merchant
     """
     try:
-        return principal_crud.create_principal(db, principal)
+        db_principal = await db.run_sync(principal_crud.create_principal, principal)
     except DuplicateSSNError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -75,22 +83,25 @@ def create_principal(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    await invalidate_cache(PRINCIPALS_NAMESPACE)
+    return db_principal
 
 
 @router.get("/principals/{principal_id}", response_model=Principal)
-def read_principal(
+async def read_principal(
         principal_id: int,
-        db: Session = Depends(get_db)
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db)
 ):
-    """Get a specific principal by ID"""
+    """Get a specific principal by ID (supports If-None-Match)"""
     try:
-        principal = principal_crud.get_principal(db, principal_id=principal_id)
+        principal = await db.run_sync(principal_crud.get_principal, principal_id=principal_id)
         if principal is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Principal not found"
             )
-        return principal
     except PrincipalCRUDError as e:
         logger.error(f"Error fetching principal {principal_id}: {str(e)}")
         raise HTTPException(
@@ -98,22 +109,28 @@ def read_principal(
             detail="Failed to fetch principal"
         )
 
+    etag = resource_etag(principal)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return principal
+
 
 @router.get("/merchants/{merchant_id}/principals/", response_model=PrincipalListResponse)
-def read_merchant_principals(
+async def read_merchant_principals(
         merchant_id: int,
         only_guarantors: bool = Query(False, description="Filter only guarantors"),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get all principals for a specific merchant"""
     try:
-        principals = principal_crud.get_principals_by_merchant(
-            db,
+        principals = await db.run_sync(
+            principal_crud.get_principals_by_merchant,
             merchant_id=merchant_id,
             only_guarantors=only_guarantors
         )
         return PrincipalListResponse(
-            principals=principals,
+            principals=[from_orm_fast(Principal, principal) for principal in principals],
             total=len(principals),
             merchant_id=merchant_id
         )
@@ -126,13 +143,14 @@ def read_merchant_principals(
 
 
 @router.get("/merchants/{merchant_id}/principals/ownership-summary")
-def read_merchant_ownership_summary(
+@cache(expire=CACHE_TTL_NORMAL, namespace=PRINCIPALS_NAMESPACE)
+async def read_merchant_ownership_summary(
         merchant_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get ownership summary for a merchant"""
     try:
-        return principal_crud.get_merchant_ownership_summary(db, merchant_id)
+        return await db.run_sync(principal_crud.get_merchant_ownership_summary, merchant_id)
     except PrincipalCRUDError as e:
         logger.error(f"Error getting ownership summary: {str(e)}")
         raise HTTPException(
@@ -142,9 +160,9 @@ def read_merchant_ownership_summary(
 
 
 @router.get("/principals/search/by-ssn", response_model=List[Principal])
-def search_principals_by_ssn(
+async def search_principals_by_ssn(
         ssn: str = Query(..., regex="^\\d{3}-\\d{2}-\\d{4}$"),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Search for principals by SSN across all merchants
@@ -152,12 +170,9 @@ def search_principals_by_ssn(
     Note: Returns partial SSN in response for security
     """
     try:
-        principals = principal_crud.get_principals_by_ssn(db, ssn)
-        # Mask SSN in response for security
-        for principal in principals:
-            if principal.ssn:
-                principal.ssn = f"{principal.ssn[:3]}-XX-XXXX"
-        return principals
+        rows = await db.run_sync(principal_crud.get_masked_principal_rows_by_ssn, ssn)
+        # SSN is already masked by the query; model_construct skips the SSN format validator
+        return [Principal.model_construct(**row) for row in rows]
     except PrincipalCRUDError as e:
         logger.error(f"Error searching principals by SSN: {str(e)}")
         raise HTTPException(
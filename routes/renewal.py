@@ -1,10 +1,16 @@
 # app/routes/renewal.py
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import date
 
-from app.database import get_db
+from app.cache import (
+    CACHE_TTL_LONG, CACHE_TTL_NORMAL, RENEWALS_NAMESPACE, cache_with_stale_fallback,
+    etag_matches, invalidate_cache, resource_etag
+)
+from app.database import get_async_db
 from app.schemas.renewal import (
     RenewalInfo, RenewalInfoCreate, RenewalInfoUpdate,
     DealRenewalJunction, DealRenewalRelationship,
@@ -14,38 +20,46 @@ from app.schemas.deal import Deal
 from app.crud import renewal as crud
 from app.crud import deal as deal_crud
 from app.crud import merchant as merchant_crud
-from app.crud import offer as offer_crud
 
 router = APIRouter(
     prefix="/api/v1/renewals",
-    tags=["renewals"]
+    tags=["renewals"],
+    default_response_class=ORJSONResponse
 )
 
 
 # Renewal Deal Creation
 @router.post("/deals", response_model=Deal, status_code=201)
-def create_renewal_deal(
+async def create_renewal_deal(
         renewal_data: CreateRenewalDeal,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new renewal deal that pays off one or more old deals"""
+    # Merchant, offer and every old deal are loaded together in one query
+    context = await db.run_sync(
+        crud.load_renewal_context,
+        renewal_data.merchant_id,
+        renewal_data.offer_id,
+        [d.old_deal_id for d in renewal_data.old_deals]
+    )
+    deal_context = context.deal_context
+
     # Verify merchant exists
-    merchant = merchant_crud.get_merchant(db, renewal_data.merchant_id)
-    if not merchant:
+    if not deal_context.merchant_exists:
         raise HTTPException(status_code=404, detail="Merchant not found")
 
     # Verify offer exists and belongs to merchant
-    offer = offer_crud.get_offer(db, renewal_data.offer_id)
-    if not offer:
+    if not deal_context.offer_exists:
         raise HTTPException(status_code=404, detail="Offer not found")
-    if offer.merchant_id != renewal_data.merchant_id:
+    if not deal_context.offer_belongs:
         raise HTTPException(status_code=400, detail="Offer does not belong to merchant")
-    if offer.status != "selected":
+    if deal_context.offer_status != "selected":
         raise HTTPException(status_code=400, detail="Offer must be in 'selected' status")
 
     # Verify all old deals exist and belong to the merchant
+    old_deals = context.old_deals
     for old_deal_info in renewal_data.old_deals:
-        old_deal = deal_crud.get_deal(db, old_deal_info.old_deal_id)
+        old_deal = old_deals.get(old_deal_info.old_deal_id)
         if not old_deal:
             raise HTTPException(
                 status_code=404,
@@ -63,77 +77,92 @@ def create_renewal_deal(
             )
 
     try:
-        return crud.create_renewal_deal(db=db, renewal_data=renewal_data)
+        db_deal = await db.run_sync(
+            crud.create_renewal_deal, renewal_data=renewal_data, offer=deal_context.offer
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    await invalidate_cache(RENEWALS_NAMESPACE)
+    return db_deal
 
 
 # Renewal Info Management
 @router.get("/info/{renewal_info_id}", response_model=RenewalInfo)
-def get_renewal_info(
+async def get_renewal_info(
         renewal_info_id: int,
-        db: Session = Depends(get_db)
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db)
 ):
-    """Get a specific renewal info record"""
-    renewal_info = db.query(crud.RenewalInfo).filter(
-        crud.RenewalInfo.id == renewal_info_id
-    ).first()
+    """Get a specific renewal info record (supports If-None-Match)"""
+    renewal_info = await db.run_sync(crud.get_renewal_info, renewal_info_id)
     if not renewal_info:
         raise HTTPException(status_code=404, detail="Renewal info not found")
+
+    etag = resource_etag(renewal_info)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return renewal_info
 
 
 @router.put("/info/{renewal_info_id}", response_model=RenewalInfo)
-def update_renewal_info(
+async def update_renewal_info(
         renewal_info_id: int,
         update_data: RenewalInfoUpdate,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Update a renewal info record"""
-    renewal_info = crud.update_renewal_info(db=db, renewal_info_id=renewal_info_id, update_data=update_data)
+    renewal_info = await db.run_sync(
+        crud.update_renewal_info, renewal_info_id=renewal_info_id, update_data=update_data
+    )
     if not renewal_info:
         raise HTTPException(status_code=404, detail="Renewal info not found")
+    await invalidate_cache(RENEWALS_NAMESPACE)
     return renewal_info
 
 
 # Deal Renewal Information
 @router.get("/deals/{deal_id}/renewal-info", response_model=List[RenewalInfo])
-def get_renewal_info_by_deal(
+async def get_renewal_info_by_deal(
         deal_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get all renewal info records for a renewal deal"""
-    deal = deal_crud.get_deal(db, deal_id)
+    deal = await db.run_sync(deal_crud.get_deal, deal_id)
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
     if not deal.is_renewal:
         raise HTTPException(status_code=400, detail="Deal is not a renewal")
 
-    return crud.get_renewal_info_by_deal(db=db, deal_id=deal_id)
+    return await db.run_sync(crud.get_renewal_info_by_deal, deal_id=deal_id)
 
 
 @router.get("/deals/{deal_id}/old-deals")
-def get_old_deals_for_renewal(
+async def get_old_deals_for_renewal(
         deal_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get all old deals that were renewed by this renewal deal"""
-    deal = deal_crud.get_deal(db, deal_id)
+    deal = await db.run_sync(deal_crud.get_deal, deal_id)
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
     if not deal.is_renewal:
         raise HTTPException(status_code=400, detail="Deal is not a renewal")
 
-    return crud.get_deals_renewed_by(db=db, renewal_deal_id=deal_id)
+    return await db.run_sync(crud.get_deals_renewed_by, renewal_deal_id=deal_id)
 
 
 @router.get("/deals/{deal_id}/summary", response_model=RenewalSummary)
-def get_renewal_summary(
+@cache_with_stale_fallback(expire=CACHE_TTL_NORMAL, namespace=RENEWALS_NAMESPACE)
+async def get_renewal_summary(
         deal_id: int,
-        db: Session = Depends(get_db)
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get renewal summary for a renewal deal"""
-    summary = crud.get_renewal_summary(db=db, deal_id=deal_id)
+    summary = await db.run_sync(crud.get_renewal_summary, deal_id=deal_id)
     if not summary:
         raise HTTPException(
             status_code=404,
@@ -144,24 +173,25 @@ def get_renewal_summary(
 
 # Renewal Chain Information
 @router.get("/deals/{deal_id}/chain", response_model=RenewalChain)
-def get_renewal_chain(
+@cache(expire=CACHE_TTL_LONG, namespace=RENEWALS_NAMESPACE)
+async def get_renewal_chain(
         deal_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get the complete renewal chain for any deal"""
     try:
-        return crud.get_renewal_chain(db=db, deal_id=deal_id)
+        return await db.run_sync(crud.get_renewal_chain, deal_id=deal_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Deal not found")
 
 
 @router.get("/deals/{deal_id}/renewed-into")
-def check_if_renewed(
+async def check_if_renewed(
         deal_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Check if a deal was renewed and get the renewal deal info"""
-    renewal_info = crud.get_renewal_deal_for(db=db, old_deal_id=deal_id)
+    renewal_info = await db.run_sync(crud.get_renewal_deal_for, old_deal_id=deal_id)
     if not renewal_info:
         return {"was_renewed": False, "renewal_deal": None}
     return {"was_renewed": True, "renewal_deal": renewal_info}
@@ -169,14 +199,14 @@ def check_if_renewed(
 
 # Renewal Management
 @router.post("/reverse")
-def reverse_renewal(
+async def reverse_renewal(
         old_deal_id: int,
         new_deal_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Reverse a renewal relationship (e.g., if funding fails)"""
-    success = crud.reverse_renewal(
-        db=db,
+    success = await db.run_sync(
+        crud.reverse_renewal,
         old_deal_id=old_deal_id,
         new_deal_id=new_deal_id
     )
@@ -185,43 +215,36 @@ def reverse_renewal(
             status_code=404,
             detail="Renewal relationship not found or already reversed"
         )
+    await invalidate_cache(RENEWALS_NAMESPACE)
     return {"message": "Renewal reversed successfully"}
 
 
 # Merchant Renewal Information
 @router.get("/merchants/{merchant_id}/renewal-deals", response_model=List[Deal])
-def get_merchant_renewal_deals(
+async def get_merchant_renewal_deals(
         merchant_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get all renewal deals for a merchant"""
     # Verify merchant exists
-    merchant = merchant_crud.get_merchant(db, merchant_id)
+    merchant = await db.run_sync(merchant_crud.get_merchant, merchant_id)
     if not merchant:
         raise HTTPException(status_code=404, detail="Merchant not found")
 
-    # Get all deals for merchant and filter renewals
-    deals = deal_crud.get_deals_by_merchant(db, merchant_id)
-    renewal_deals = [deal for deal in deals if deal.is_renewal]
-
-    return renewal_deals
+    return await db.run_sync(deal_crud.get_renewal_deals_by_merchant, merchant_id)
 
 
 @router.get("/relationships", response_model=List[DealRenewalRelationship])
-def get_renewal_relationships(
+async def get_renewal_relationships(
         old_deal_id: Optional[int] = None,
         new_deal_id: Optional[int] = None,
         status: Optional[str] = None,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get renewal relationships with optional filtering"""
-    query = db.query(crud.DealRenewalRelationship)
-
-    if old_deal_id:
-        query = query.filter(crud.DealRenewalRelationship.old_deal_id == old_deal_id)
-    if new_deal_id:
-        query = query.filter(crud.DealRenewalRelationship.new_deal_id == new_deal_id)
-    if status:
-        query = query.filter(crud.DealRenewalRelationship.status == status)
-
-    return query.all()
\ No newline at end of file
+    return await db.run_sync(
+        crud.get_relationships,
+        old_deal_id=old_deal_id,
+        new_deal_id=new_deal_id,
+        status=status
+    )
@@ -12,11 +12,9 @@ from pathlib import Path
 
 def run_command(cmd):
     """Execute command and return result"""
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    print(result.stdout)
-    if result.stderr:
-        print(result.stderr)
+    print(f"Running: {' '.join(cmd)}", flush=True)
+    # Child inherits our stdout/stderr, so output streams live and is never buffered here
+    result = subprocess.run(cmd)
     return result.returncode
 
 
@@ -35,6 +33,7 @@ def main():
     parser.add_argument('--cov', action='store_true', help='Generate coverage report')
     parser.add_argument('-k', '--keyword', help='Run tests matching keyword')
     parser.add_argument('--html', action='store_true', help='Generate HTML report')
+    parser.add_argument('-n', '--workers', help='Run tests in parallel (pytest-xdist), e.g. 4 or auto')
 
     args = parser.parse_args()
 
@@ -68,6 +67,11 @@ def main():
     if args.keyword:
         cmd.extend(['-k', args.keyword])
 
+    if args.workers:
+        # Each worker gets its own test database file (see tests/conftest.py); loadscope
+        # schedules each test class separately, so the API classes that share a module still spread
+        cmd.extend(['-n', args.workers, '--dist', 'loadscope'])
+
     if args.cov:
         cmd.extend(['--cov=app', '--cov-report=term-missing'])
         if args.html:
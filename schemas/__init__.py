@@ -1,26 +1,50 @@
 # app/schemas/__init__.py
-from app.schemas.merchant import Merchant, MerchantCreate, MerchantUpdate
-from app.schemas.principal import Principal, PrincipalCreate, PrincipalUpdate
-from app.schemas.offer import Offer, OfferCreate, OfferUpdate
-from app.schemas.banking import BankAccountBase, BankAccountCreate, BankAccountUpdate
-from app.schemas.payment import Payment, PaymentCreate, PaymentUpdate, PaymentFilter, PaymentSummary
-from app.schemas.deal import Deal, DealCreate, DealUpdate, DealFilter, DealSummary
-from app.schemas.renewal import (
-    RenewalInfo, RenewalInfoCreate, RenewalInfoUpdate,
-    DealRenewalJunction, DealRenewalJunctionCreate,
-    DealRenewalRelationship, DealRenewalRelationshipCreate,
-    CreateRenewalDeal, RenewalSummary, RenewalChain
-)
-
-__all__ = [
-    "Merchant", "MerchantCreate", "MerchantUpdate",
-    "Principal", "PrincipalCreate", "PrincipalUpdate",
-    "Offer", "OfferCreate", "OfferUpdate",
-    "BankAccountBase", "BankAccountCreate", "BankAccountUpdate",
-    "Payment", "PaymentCreate", "PaymentUpdate", "PaymentFilter", "PaymentSummary",
-    "Deal", "DealCreate", "DealUpdate", "DealFilter", "DealSummary",
-    "RenewalInfo", "RenewalInfoCreate", "RenewalInfoUpdate",
-    "DealRenewalJunction", "DealRenewalJunctionCreate",
-    "DealRenewalRelationship", "DealRenewalRelationshipCreate",
-    "CreateRenewalDeal", "RenewalSummary", "RenewalChain"
-]
\ No newline at end of file
+# Re-exports are resolved lazily (PEP 562): importing one schema module, or the package,
+# no longer builds every Pydantic model in the app.
+import importlib
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+_M = TypeVar("_M", bound=BaseModel)
+
+_EXPORTS = {
+    "app.schemas.merchant": ("Merchant", "MerchantCreate", "MerchantUpdate"),
+    "app.schemas.principal": ("Principal", "PrincipalCreate", "PrincipalUpdate"),
+    "app.schemas.offer": ("Offer", "OfferCreate", "OfferUpdate"),
+    "app.schemas.banking": ("BankAccountBase", "BankAccountCreate", "BankAccountUpdate"),
+    "app.schemas.payment": ("Payment", "PaymentCreate", "PaymentUpdate", "PaymentFilter", "PaymentSummary"),
+    "app.schemas.deal": ("Deal", "DealCreate", "DealUpdate", "DealFilter", "DealSummary"),
+    "app.schemas.renewal": (
+        "RenewalInfo", "RenewalInfoCreate", "RenewalInfoUpdate",
+        "DealRenewalJunction", "DealRenewalJunctionCreate",
+        "DealRenewalRelationship", "DealRenewalRelationshipCreate",
+        "CreateRenewalDeal", "RenewalSummary", "RenewalChain"
+    ),
+}
+
+_MODULE_FOR = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_FOR) + ["from_orm_fast"]
+
+
+def from_orm_fast(cls: Type[_M], orm_obj) -> _M:
+    """
+    Build a read schema straight from an ORM row without running its validators.
+    Only for rows read back from the database (already validated on the way in);
+    create/update payloads must keep going through model_validate.
+    """
+    return cls.model_construct(**{name: getattr(orm_obj, name) for name in cls.model_fields})
+
+
+def __getattr__(name):
+    module = _MODULE_FOR.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
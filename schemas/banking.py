@@ -1,25 +1,18 @@
 # app/schemas/banking.py
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
 
 class BankAccountBase(BaseModel):
     account_name: str = Field(..., min_length=1, max_length=100)
-    account_number: str = Field(..., min_length=4, max_length=4)  # Last 4 digits only
+    account_number: str = Field(..., pattern="^[0-9]{4}$")  # Last 4 digits only, checked in pydantic-core
     routing_number: str = Field(..., pattern="^[0-9]{9}$")  # Changed from regex to pattern
     bank_name: str = Field(..., min_length=1, max_length=100)
     account_type: str = Field(..., pattern="^(checking|savings)$")  # Changed from regex to pattern
     is_active: bool = True
     is_primary: bool = False
 
-    @field_validator('account_number')
-    @classmethod
-    def validate_account_number(cls, v):
-        if not v.isdigit():
-            raise ValueError('Account number must contain only digits')
-        return v
-
 
 class BankAccountCreate(BankAccountBase):
     pass
@@ -39,8 +32,7 @@ class BankAccountInDB(BankAccountBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BankAccountResponse(BankAccountInDB):
@@ -1,14 +1,15 @@
 # app/schemas/deal.py
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from decimal import Decimal
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Literal, Optional, List
 from enum import Enum
+from dataclasses import dataclass
 
 from app.schemas.merchant import Merchant
 from app.schemas.offer import Offer
 from app.schemas.banking import BankAccountBase
-from app.schemas.payment import Payment
+from app.schemas.payment import Payment, PaymentColumns
 
 
 class DealStatus(str, Enum):
@@ -26,6 +27,12 @@ class PaymentFrequency(str, Enum):
     MONTHLY = "monthly"
 
 
+# Literal twins of the enums above, used for the schema fields: pydantic-core checks
+# Literal values natively, while Enum fields call back into Python on every validation
+DealStatusValue = Literal["active", "completed", "defaulted", "suspended", "cancelled"]
+PaymentFrequencyValue = Literal["daily", "weekly", "bi-weekly", "monthly"]
+
+
 class DealBase(BaseModel):
     merchant_id: int = Field(..., description="ID of the merchant")
     offer_id: int = Field(..., description="ID of the accepted offer")
@@ -34,7 +41,7 @@ class DealBase(BaseModel):
     funded_amount: Decimal = Field(..., gt=0, decimal_places=2)
     factor_rate: Decimal = Field(..., gt=1, le=2, decimal_places=4)
     payment_amount: Decimal = Field(..., gt=0, decimal_places=2)
-    payment_frequency: PaymentFrequency
+    payment_frequency: PaymentFrequencyValue
     number_of_payments: int = Field(..., gt=0)
 
     funding_date: date
@@ -45,8 +52,10 @@ class DealBase(BaseModel):
 
     @field_validator('first_payment_date')
     @classmethod
-    def validate_first_payment_date(cls, v, values):
-        if 'funding_date' in values and v < values['funding_date']:
+    def validate_first_payment_date(cls, v, info: ValidationInfo):
+        # funding_date is missing from info.data when it failed its own validation
+        funding_date = info.data.get('funding_date')
+        if funding_date is not None and v < funding_date:
             raise ValueError('First payment date cannot be before funding date')
         return v
 
@@ -63,7 +72,7 @@ class DealCreate(BaseModel):
 
 class DealUpdate(BaseModel):
     bank_account_id: Optional[int] = None
-    status: Optional[DealStatus] = None
+    status: Optional[DealStatusValue] = None
     payment_amount: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
     in_collections: Optional[bool] = None
     collections_notes: Optional[str] = None
@@ -82,7 +91,7 @@ class Deal(DealBase):
     payments_remaining: int
     last_payment_date: Optional[date]
 
-    status: DealStatus
+    status: DealStatusValue
     actual_completion_date: Optional[date]
 
     in_collections: bool
@@ -91,8 +100,7 @@ class Deal(DealBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DealWithRelations(Deal):
@@ -102,7 +110,14 @@ class DealWithRelations(Deal):
     payments: List[Payment] = []
 
 
+class DealWithPaymentColumns(Deal):
+    """Deal plus its payment history in columnar form, for deals with long histories"""
+    payment_columns: PaymentColumns
+
+
 class DealSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     total_deals: int
     active_deals: int
     completed_deals: int
@@ -116,6 +131,8 @@ class DealSummary(BaseModel):
 
 
 class DealPerformance(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     deal_id: int
     deal_number: str
     payment_performance: float
@@ -124,9 +141,11 @@ class DealPerformance(BaseModel):
     irr: Optional[Decimal]
 
 
-class DealFilter(BaseModel):
+# Plain slotted container: the route's query parameters are already validated by FastAPI
+@dataclass(slots=True)
+class DealFilter:
     merchant_id: Optional[int] = None
-    status: Optional[DealStatus] = None
+    status: Optional[DealStatusValue] = None
     funding_date_from: Optional[date] = None
     funding_date_to: Optional[date] = None
     min_amount: Optional[Decimal] = None
@@ -1,9 +1,232 @@
 # app/schemas/merchant.py - Fixed phone field validation
-from pydantic import BaseModel, EmailStr, validator, Field, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, create_model, field_validator
+from pydantic.fields import FieldInfo
+from typing import Optional, List, Type
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import date, datetime
+from enum import Enum
 import re
 
+# Compiled once at import instead of on every validator call
+_NONDIGIT_RE = re.compile(r'\D')
+_ZIP_RE = re.compile(r'\d{5}(\d{4})?')
+# Deletes the separators allowed inside ZIP codes and FEINs (one C-level pass): the hyphen
+# and all Unicode whitespace, the same set as r'[\s-]' (spelled out, so no scan at import)
+_STRIP_SEPARATORS = str.maketrans('', '', (
+    '-\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+))
+
+# "Today" for submitted_date checks, pinned once per request by the merchant router
+# so bulk payloads don't call date.today() per item; falls back to date.today() elsewhere
+VALIDATION_DATE: ContextVar[Optional[date]] = ContextVar('validation_date', default=None)
+
+# Allowed values, built once; the tuples keep the order used in error messages
+_VALID_STATES = frozenset((
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
+    'DC', 'PR', 'VI', 'GU', 'AS', 'MP'  # Include territories
+))
+
+_ENTITY_TYPES = (
+    'LLC', 'Corporation', 'S-Corp', 'C-Corp',
+    'Partnership', 'Sole Proprietorship', 'LLP',
+    'Non-Profit', 'Other'
+)
+_VALID_ENTITY_TYPES = frozenset(_ENTITY_TYPES)
+_ENTITY_TYPES_MSG = ", ".join(_ENTITY_TYPES)
+
+_STATUSES = (
+    'lead', 'prospect', 'application_sent', 'application_received',
+    'in_underwriting', 'approved', 'declined', 'funded', 'renewed',
+    'churned', 'blacklisted'
+)
+_VALID_STATUSES = frozenset(_STATUSES)
+_STATUSES_MSG = ", ".join(_STATUSES)
+
+_DISPOSABLE_EMAIL_DOMAINS = frozenset((
+    'tempmail.com', 'throwaway.email', 'guerrillamail.com',
+    'mailinator.com', '10minutemail.com', 'temp-mail.org',
+    'dispostable.com', 'yopmail.com', 'maildrop.cc'
+))
+
+
+# Query parameter enums for the merchant list/status endpoints
+class MerchantStatus(str, Enum):
+    LEAD = "lead"
+    PROSPECT = "prospect"
+    APPLICANT = "applicant"
+    APPROVED = "approved"
+    DECLINED = "declined"
+    FUNDED = "funded"
+    CLOSED = "closed"
+
+
+class MerchantSortField(str, Enum):
+    COMPANY_NAME = "company_name"
+    STATUS = "status"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
+class SortOrder(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+def _collapse_ws(s: str) -> str:
+    """Same result as ' '.join(s.split()), without the split when s is already clean"""
+    s = s.strip()
+    # isprintable() is False for every whitespace character except the plain space
+    if '  ' not in s and s.isprintable():
+        return s
+    return ' '.join(s.split())
+
+
+# Backend-only validators - focus on business rules and data integrity.
+# Plain functions so MerchantBase and MerchantUpdate register the same objects.
+def _clean_company_name(v):
+    if not v or not v.strip():
+        raise ValueError('Company name cannot be empty')
+    # Clean up whitespace
+    v = _collapse_ws(v)
+    # Basic length check (business rule)
+    if len(v) < 2:
+        raise ValueError('Company name must be at least 2 characters')
+    return v
+
+
+def _clean_state(v):
+    if v is None or v == "":
+        return None
+    # Normalize and validate state code (business rule)
+    v = v.upper().strip()
+    if v not in _VALID_STATES:
+        raise ValueError('Invalid state code')
+    return v
+
+
+def _clean_zip(v):
+    if v is None or v == "":
+        return None
+    # Basic sanitization - store clean digits only
+    cleaned = v.strip().translate(_STRIP_SEPARATORS)
+    # One match covers both the digits-only and 5/9 length rules; the
+    # separate checks only run to pick the error message
+    if not _ZIP_RE.fullmatch(cleaned):
+        if not cleaned.isdigit():
+            raise ValueError('ZIP code must contain only digits')
+        raise ValueError('ZIP code must be 5 or 9 digits')
+    return cleaned
+
+
+def _clean_fein(v):
+    if v is None or v == "":
+        return None
+    # Clean and validate FEIN (business rule)
+    cleaned = v.strip().translate(_STRIP_SEPARATORS)
+    if len(cleaned) != 9 or not cleaned.isdecimal():
+        raise ValueError('FEIN must be exactly 9 digits')
+    return cleaned
+
+
+def _clean_phone(v):
+    # Handle empty string from frontend - convert to None
+    if v is None or v == "" or not v.strip():
+        return None
+    # Clean phone number - store digits only
+    digits = _NONDIGIT_RE.sub('', v)
+    # If no digits after cleaning, return None
+    if not digits:
+        return None
+    # Validate length (business rule)
+    if len(digits) == 11 and digits[0] == '1':
+        digits = digits[1:]  # Remove country code
+    if len(digits) != 10:
+        raise ValueError('Phone number must be exactly 10 digits')
+    return digits
+
+
+def _clean_entity_type(v):
+    if v is None or v == "":
+        return None
+    # Business rule validation
+    if v not in _VALID_ENTITY_TYPES:
+        raise ValueError(f'Invalid entity type. Must be one of: {_ENTITY_TYPES_MSG}')
+    return v
+
+
+def _clean_status(v):
+    if v is None or v == "":
+        return 'lead'
+    # Workflow integrity validation (critical business rule)
+    if v not in _VALID_STATUSES:
+        raise ValueError(f'Invalid status. Must be one of: {_STATUSES_MSG}')
+    return v
+
+
+def _clean_submitted_date(v):
+    if v is None:
+        return v
+    # Business rule: prevent future dates (data integrity)
+    if v > (VALIDATION_DATE.get() or date.today()):
+        raise ValueError('Submitted date cannot be in the future')
+    # Business rule: prevent unrealistic past dates
+    if v.year < 2000:
+        raise ValueError('Submitted date cannot be before year 2000')
+    return v
+
+
+def _clean_email(v):
+    if v is None:
+        return v
+    # Security validation: block disposable emails (anti-fraud)
+    domain = v.rpartition('@')[2].lower()
+    if domain in _DISPOSABLE_EMAIL_DOMAINS:
+        raise ValueError('Disposable email addresses are not allowed')
+    return v
+
+
+def _clean_contact_person(v):
+    if v is None or v == "":
+        return None
+    # Basic data cleaning
+    v = _collapse_ws(v)
+    # Minimum business requirement
+    if len(v) < 2:
+        raise ValueError('Contact person name must be at least 2 characters')
+    return v
+
+
+def _clean_city(v):
+    if v is None or v == "":
+        return None
+    # Basic data cleaning
+    v = _collapse_ws(v)
+    # Minimum business requirement
+    if len(v) < 2:
+        raise ValueError('City name must be at least 2 characters')
+    return v
+
+
+def _clean_address(v):
+    if v is None or v == "":
+        return None
+    # Basic data cleaning
+    v = _collapse_ws(v)
+    return v if v else None
+
+
+def _clean_notes(v):
+    if v is None or v == "":
+        return None
+    return v
+
 
 class MerchantBase(BaseModel):
     company_name: str = Field(
@@ -70,167 +293,19 @@ class MerchantBase(BaseModel):
     )
 
     # Backend-only validators - focus on business rules and data integrity
-    @field_validator('company_name')
-    def validate_company_name(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Company name cannot be empty')
-        # Clean up whitespace
-        v = ' '.join(v.split())
-        # Basic length check (business rule)
-        if len(v) < 2:
-            raise ValueError('Company name must be at least 2 characters')
-        return v
-
-    @field_validator('state')
-    def validate_state(cls, v):
-        if v is None or v == "":
-            return None
-        # Normalize and validate state code (business rule)
-        v = v.upper().strip()
-        valid_states = [
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-            'DC', 'PR', 'VI', 'GU', 'AS', 'MP'  # Include territories
-        ]
-        if v not in valid_states:
-            raise ValueError('Invalid state code')
-        return v
-
-    @field_validator('zip')
-    def validate_zip(cls, v):
-        if v is None or v == "":
-            return None
-        # Basic sanitization - store clean digits only
-        cleaned = re.sub(r'[\s-]', '', v.strip())
-        # Basic validation - ensure it's numeric
-        if not cleaned.isdigit():
-            raise ValueError('ZIP code must contain only digits')
-        # Length validation (business rule)
-        if len(cleaned) not in [5, 9]:
-            raise ValueError('ZIP code must be 5 or 9 digits')
-        return cleaned
-
-    @field_validator('fein')
-    def validate_fein(cls, v):
-        if v is None or v == "":
-            return None
-        # Clean and validate FEIN (business rule)
-        cleaned = re.sub(r'[\s-]', '', v.strip())
-        if not re.match(r'^\d{9}$', cleaned):
-            raise ValueError('FEIN must be exactly 9 digits')
-        return cleaned
-
-    @field_validator('phone')
-    def validate_phone(cls, v):
-        # Handle empty string from frontend - convert to None
-        if v is None or v == "" or not v.strip():
-            return None
-        # Clean phone number - store digits only
-        digits = re.sub(r'\D', '', v)
-        # If no digits after cleaning, return None
-        if not digits:
-            return None
-        # Validate length (business rule)
-        if len(digits) == 11 and digits[0] == '1':
-            digits = digits[1:]  # Remove country code
-        if len(digits) != 10:
-            raise ValueError('Phone number must be exactly 10 digits')
-        return digits
-
-    @field_validator('entity_type')
-    def validate_entity_type(cls, v):
-        if v is None or v == "":
-            return None
-        # Business rule validation
-        valid_types = [
-            'LLC', 'Corporation', 'S-Corp', 'C-Corp',
-            'Partnership', 'Sole Proprietorship', 'LLP',
-            'Non-Profit', 'Other'
-        ]
-        if v not in valid_types:
-            raise ValueError(f'Invalid entity type. Must be one of: {", ".join(valid_types)}')
-        return v
-
-    @field_validator('status')
-    def validate_status(cls, v):
-        if v is None or v == "":
-            return 'lead'
-        # Workflow integrity validation (critical business rule)
-        valid_statuses = [
-            'lead', 'prospect', 'application_sent', 'application_received',
-            'in_underwriting', 'approved', 'declined', 'funded', 'renewed',
-            'churned', 'blacklisted'
-        ]
-        if v not in valid_statuses:
-            raise ValueError(f'Invalid status. Must be one of: {", ".join(valid_statuses)}')
-        return v
-
-    @field_validator('submitted_date')
-    def validate_submitted_date(cls, v):
-        if v is None:
-            return v
-        # Business rule: prevent future dates (data integrity)
-        if v > date.today():
-            raise ValueError('Submitted date cannot be in the future')
-        # Business rule: prevent unrealistic past dates
-        if v.year < 2000:
-            raise ValueError('Submitted date cannot be before year 2000')
-        return v
-
-    @field_validator('email')
-    def validate_email_security(cls, v):
-        if v is None:
-            return v
-        # Security validation: block disposable emails (anti-fraud)
-        email_lower = v.lower()
-        disposable_domains = [
-            'tempmail.com', 'throwaway.email', 'guerrillamail.com',
-            'mailinator.com', '10minutemail.com', 'temp-mail.org',
-            'dispostable.com', 'yopmail.com', 'maildrop.cc'
-        ]
-        domain = email_lower.split('@')[-1]
-        if domain in disposable_domains:
-            raise ValueError('Disposable email addresses are not allowed')
-        return v
-
-    @field_validator('contact_person')
-    def validate_contact_person(cls, v):
-        if v is None or v == "":
-            return None
-        # Basic data cleaning
-        v = ' '.join(v.split())
-        # Minimum business requirement
-        if len(v) < 2:
-            raise ValueError('Contact person name must be at least 2 characters')
-        return v
-
-    @field_validator('city')
-    def validate_city(cls, v):
-        if v is None or v == "":
-            return None
-        # Basic data cleaning
-        v = ' '.join(v.split())
-        # Minimum business requirement
-        if len(v) < 2:
-            raise ValueError('City name must be at least 2 characters')
-        return v
-
-    @field_validator('address')
-    def validate_address(cls, v):
-        if v is None or v == "":
-            return None
-        # Basic data cleaning
-        v = ' '.join(v.split())
-        return v if v else None
-
-    @field_validator('notes')
-    def validate_notes(cls, v):
-        if v is None or v == "":
-            return None
-        return v
+    _validate_company_name = field_validator('company_name')(_clean_company_name)
+    _validate_state = field_validator('state')(_clean_state)
+    _validate_zip = field_validator('zip')(_clean_zip)
+    _validate_fein = field_validator('fein')(_clean_fein)
+    _validate_phone = field_validator('phone')(_clean_phone)
+    _validate_entity_type = field_validator('entity_type')(_clean_entity_type)
+    _validate_status = field_validator('status')(_clean_status)
+    _validate_submitted_date = field_validator('submitted_date')(_clean_submitted_date)
+    _validate_email = field_validator('email')(_clean_email)
+    _validate_contact_person = field_validator('contact_person')(_clean_contact_person)
+    _validate_city = field_validator('city')(_clean_city)
+    _validate_address = field_validator('address')(_clean_address)
+    _validate_notes = field_validator('notes')(_clean_notes)
 
 
 class MerchantCreate(MerchantBase):
@@ -242,61 +317,17 @@ class MerchantCreate(MerchantBase):
         return v
 
 
-class MerchantUpdate(BaseModel):
-    company_name: Optional[str] = Field(None, min_length=2, max_length=255)
-    address: Optional[str] = Field(None, max_length=500)
-    city: Optional[str] = Field(None, min_length=2, max_length=100)
-    state: Optional[str] = Field(None, min_length=2, max_length=2)
-    zip: Optional[str] = None
-    fein: Optional[str] = None
-    phone: Optional[str] = None
-    entity_type: Optional[str] = None
-    submitted_date: Optional[date] = None
-    email: Optional[EmailStr] = None
-    contact_person: Optional[str] = Field(None, min_length=2, max_length=255)
-    status: Optional[str] = None
-    notes: Optional[str] = Field(None, max_length=5000)
-
-    # Copy validators from MerchantBase - using the old validator syntax for compatibility
-    _validate_company_name = validator('company_name', allow_reuse=True)(
-        MerchantBase.validate_company_name
-    )
-    _validate_state = validator('state', allow_reuse=True)(
-        MerchantBase.validate_state
-    )
-    _validate_zip = validator('zip', allow_reuse=True)(
-        MerchantBase.validate_zip
-    )
-    _validate_fein = validator('fein', allow_reuse=True)(
-        MerchantBase.validate_fein
-    )
-    _validate_phone = validator('phone', allow_reuse=True)(
-        MerchantBase.validate_phone
-    )
-    _validate_entity_type = validator('entity_type', allow_reuse=True)(
-        MerchantBase.validate_entity_type
-    )
-    _validate_status = validator('status', allow_reuse=True)(
-        MerchantBase.validate_status
-    )
-    _validate_submitted_date = validator('submitted_date', allow_reuse=True)(
-        MerchantBase.validate_submitted_date
-    )
-    _validate_email = validator('email', allow_reuse=True)(
-        MerchantBase.validate_email_security
-    )
-    _validate_contact_person = validator('contact_person', allow_reuse=True)(
-        MerchantBase.validate_contact_person
-    )
-    _validate_city = validator('city', allow_reuse=True)(
-        MerchantBase.validate_city
-    )
-    _validate_address = validator('address', allow_reuse=True)(
-        MerchantBase.validate_address
-    )
-    _validate_notes = validator('notes', allow_reuse=True)(
-        MerchantBase.validate_notes
-    )
+def _make_partial(model: Type[BaseModel], name: str) -> Type[BaseModel]:
+    """Subclass `model` with every field optional and defaulting to None (for PATCH-style updates)"""
+    fields = {
+        field_name: (Optional[field.annotation], FieldInfo.merge_field_infos(field, default=None))
+        for field_name, field in model.model_fields.items()
+    }
+    # Validators are inherited from `model`, so both classes share the same functions
+    return create_model(name, __base__=model, __module__=__name__, **fields)
+
+
+MerchantUpdate = _make_partial(MerchantBase, "MerchantUpdate")
 
 
 class Merchant(MerchantBase):
@@ -304,19 +335,29 @@ class Merchant(MerchantBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def model_validate_many(cls, rows) -> List["Merchant"]:
+        """Validate a list of rows (ORM objects or dicts) in one pydantic-core call"""
+        return _MERCHANT_LIST.validate_python(rows, from_attributes=True)
+
+
+_MERCHANT_LIST = TypeAdapter(List[Merchant])
 
 
 # Response models
-class MerchantListResponse(BaseModel):
+# A dataclass: FastAPI validates it once against response_model, so building it is free
+@dataclass(slots=True)
+class MerchantListResponse:
     merchants: List[Merchant]
     total: int
     page: int
     per_page: int
 
 
-class ValidationErrorDetail(BaseModel):
+@dataclass(slots=True)
+class ValidationErrorDetail:
     field: str
     message: str
     type: str
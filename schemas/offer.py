@@ -1,20 +1,23 @@
 # app/schemas/offer.py
-from pydantic import BaseModel, computed_field, field_validator, model_validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, computed_field, field_validator, model_validator
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 
+# Shared default / fallback so the fee fields are always Decimal (never float or int)
+_ZERO = Decimal("0.00")
+
 
 class OfferBase(BaseModel):
     merchant_id: int
     advance: Decimal
     factor: Decimal
-    upfront_fees: Optional[Decimal] = 0.00
-    upfront_fee_percentage: Optional[Decimal] = 0.00
+    upfront_fees: Optional[Decimal] = _ZERO
+    upfront_fee_percentage: Optional[Decimal] = _ZERO
     specified_percentage: Decimal
     payment_frequency: Optional[str] = "daily"
     renewal: Optional[bool] = False
-    transfer_balance: Optional[Decimal] = 0.00
+    transfer_balance: Optional[Decimal] = _ZERO
     deal_id: Optional[str] = None
     status: Optional[str] = "draft"
 
@@ -61,12 +64,12 @@ class Offer(BaseModel):
     merchant_id: int
     advance: Decimal
     factor: Decimal
-    upfront_fees: Optional[Decimal] = 0.00
-    upfront_fee_percentage: Optional[Decimal] = 0.00
+    upfront_fees: Optional[Decimal] = _ZERO
+    upfront_fee_percentage: Optional[Decimal] = _ZERO
     specified_percentage: Decimal
     payment_frequency: Optional[str] = "daily"
     renewal: Optional[bool] = False
-    transfer_balance: Optional[Decimal] = 0.00
+    transfer_balance: Optional[Decimal] = _ZERO
     deal_id: Optional[str] = None
     status: Optional[str] = "draft"
 
@@ -93,7 +96,12 @@ class Offer(BaseModel):
     @property
     def calculated_net_funds(self) -> Decimal:
         """Calculate net funds: advance - upfront_fees"""
-        return self.advance - (self.upfront_fees or 0)
+        return self.advance - (self.upfront_fees or _ZERO)
+
+    model_config = ConfigDict(from_attributes=True)
+
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+class OfferPage(BaseModel):
+    """A page of offers and the cursor for the next one"""
+    data: List[Offer]
+    next_cursor: Optional[int] = None
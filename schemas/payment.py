@@ -1,10 +1,27 @@
 # app/schemas/payment.py
-from pydantic import BaseModel, Field, validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, computed_field
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional, List
+from typing import Annotated, Literal, Optional, List
+from contextvars import ContextVar
+from dataclasses import dataclass
 from enum import Enum
 
+# "Now" for the future-date checks, pinned once per request by the payment router
+# so bulk payloads don't read the clock per item; falls back to datetime.now() elsewhere
+VALIDATION_NOW: ContextVar[Optional[datetime]] = ContextVar('validation_now', default=None)
+
+
+def _not_future(v: datetime) -> datetime:
+    if v > (VALIDATION_NOW.get() or datetime.now()):
+        raise ValueError('Payment date cannot be in the future')
+    return v
+
+
+# Attached to the type so Optional[PaymentDate] never calls into Python for None.
+# Amounts need no Python validator: Field(gt=0) is enforced by pydantic-core.
+PaymentDate = Annotated[datetime, AfterValidator(_not_future)]
+
 
 class PaymentType(str, Enum):
     ACH = "ACH"
@@ -16,76 +33,88 @@ class PaymentType(str, Enum):
     OTHER = "Other"
 
 
+# String values of PaymentType for the schema fields (see DealStatusValue); strings, not
+# members, so the 422 message lists 'ACH', 'Wire', ...
+PaymentTypeValue = Literal["ACH", "Wire", "Check", "Credit Card", "Debit Card", "Cash", "Other"]
+
+
 class PaymentBase(BaseModel):
     deal_id: int = Field(..., description="ID of the associated deal")
-    date: datetime = Field(..., description="Date of the payment")
+    date: PaymentDate = Field(..., description="Date of the payment")
     amount: Decimal = Field(..., gt=0, decimal_places=2, description="Payment amount")
-    type: PaymentType = Field(..., description="Type of payment")
+    type: PaymentTypeValue = Field(..., description="Type of payment")
     bounced: bool = Field(default=False, description="Whether the payment bounced")
     notes: Optional[str] = Field(None, max_length=1000, description="Optional notes about the payment")
 
-    @validator('amount')
-    def validate_amount(cls, v):
-        if v <= 0:
-            raise ValueError('Payment amount must be greater than 0')
-        return v
-
-    @validator('date')
-    def validate_date(cls, v):
-        if v > datetime.now():
-            raise ValueError('Payment date cannot be in the future')
-        return v
-
 
 class PaymentCreate(PaymentBase):
     pass
 
 
 class PaymentUpdate(BaseModel):
-    date: Optional[datetime] = None
+    date: Optional[PaymentDate] = None
     amount: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
-    type: Optional[PaymentType] = None
+    type: Optional[PaymentTypeValue] = None
     bounced: Optional[bool] = None
     notes: Optional[str] = Field(None, max_length=1000)
 
-    @validator('amount')
-    def validate_amount(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError('Payment amount must be greater than 0')
-        return v
-
-    @validator('date')
-    def validate_date(cls, v):
-        if v is not None and v > datetime.now():
-            raise ValueError('Payment date cannot be in the future')
-        return v
-
 
 class Payment(PaymentBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PaymentPage(BaseModel):
+    """A page of payments and the cursor for the next one"""
+    data: List[Payment]
+    next_cursor: Optional[str] = None
+
+
+class PaymentColumns(BaseModel):
+    """A deal's payments as parallel arrays (index i of each list is one payment)"""
+    ids: List[int] = []
+    dates: List[datetime] = []
+    amounts: List[Decimal] = []
+    types: List[str] = []
+    bounced: List[bool] = []
 
 
 class PaymentSummary(BaseModel):
     """Summary statistics for payments"""
+    model_config = ConfigDict(frozen=True)
+
     total_payments: int
     total_amount: Decimal
     total_bounced: int
     bounced_amount: Decimal
     last_payment_date: Optional[datetime]
-    average_payment: Optional[Decimal]
+
+    @computed_field
+    @property
+    def average_payment(self) -> Optional[Decimal]:
+        """Mean payment amount, derived from the totals (None when there are no payments)"""
+        return self.total_amount / self.total_payments if self.total_payments else None
+
+
+class PaymentTypeStat(BaseModel):
+    """Payment count and amounts for one payment type"""
+    type: PaymentTypeValue
+    count: int
+    total_amount: float
+    avg_amount: float
 
 
-class PaymentFilter(BaseModel):
+# Same kind of container as DealFilter
+@dataclass(slots=True)
+class PaymentFilter:
     """Filters for searching payments"""
     deal_id: Optional[int] = None
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
-    type: Optional[PaymentType] = None
+    type: Optional[PaymentTypeValue] = None
     bounced: Optional[bool] = None
     min_amount: Optional[Decimal] = None
     max_amount: Optional[Decimal] = None
\ No newline at end of file
@@ -1,10 +1,139 @@
 # app/schemas/principal.py
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
-from typing import Optional, List
+from pydantic import (
+    AfterValidator, BaseModel, Field, StringConstraints, field_validator, model_validator, ConfigDict
+)
+from typing import Annotated, Optional, List
 from datetime import date, datetime
 from decimal import Decimal
+import functools
 import re
 
+# Compiled once at import instead of on every validator call
+_NAME_RE = re.compile(r"^[a-zA-Z\s\-'.]+$")
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Everything _NAME_RE allows besides letters (deleted in one pass to find the letters)
+_NAME_PUNCTUATION = str.maketrans('', '', " -'.")
+# E.164 prefix by digit count; any other length is rejected
+_PHONE_PREFIX = {10: '+1', 11: '+', 12: '+', 13: '+', 14: '+', 15: '+'}
+
+_VALID_STATES = frozenset((
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FL',
+    'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME',
+    'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH',
+    'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI',
+    'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI',
+    'WY', 'PR', 'VI', 'GU', 'AS', 'MP'  # Include territories
+))
+
+
+# Shared by PrincipalBase and PrincipalUpdate (registered with field_validator on both)
+def _clean_name(v: str) -> str:
+    if v:
+        # Remove extra whitespace and strip
+        v = ' '.join(v.split()).strip()
+        # Check for valid characters
+        if not _NAME_RE.match(v):
+            raise ValueError('Name can only contain letters, spaces, hyphens, and apostrophes')
+        # Check for minimum meaningful length
+        if not v.translate(_NAME_PUNCTUATION):
+            raise ValueError('Name must contain at least one letter')
+    return v
+
+
+# Validators for the optional string fields. They are attached through the
+# Optional[Annotated[...]] types below rather than @field_validator, so pydantic-core
+# returns None itself and only calls into Python for real values. The length
+# constraints sit before the validator, so they still see the raw input.
+# The pure normalizers for zip/phone/email are memoized: the same principal is often
+# resubmitted (retries, batch imports), and a hit skips the regex work. Invalid input
+# raises and is never cached. SSNs are deliberately not kept in a cache.
+def _clean_ssn(v: str) -> str:
+    # Remove any non-numeric characters
+    cleaned = _NON_DIGIT_RE.sub('', v)
+    if len(cleaned) != 9:
+        raise ValueError('SSN must contain exactly 9 digits')
+
+    # Validate SSN rules on the fixed-width digit groups (string compares, no int())
+    area, group, serial = cleaned[:3], cleaned[3:5], cleaned[5:]
+    # First three digits can't be 000, 666, or 900-999
+    if area == '000' or area == '666' or area >= '900':
+        raise ValueError('Invalid SSN: Invalid area number')
+
+    # Middle two digits can't be 00
+    if group == '00':
+        raise ValueError('Invalid SSN: Invalid group number')
+
+    # Last four digits can't be 0000
+    if serial == '0000':
+        raise ValueError('Invalid SSN: Invalid serial number')
+
+    # Format as XXX-XX-XXXX
+    return f"{area}-{group}-{serial}"
+
+
+def _clean_state(v: str) -> str:
+    v = v.upper().strip()
+    if v not in _VALID_STATES:
+        raise ValueError(f'Invalid state code: {v}')
+    return v
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_zip(v: str) -> str:
+    # Remove any spaces or hyphens for validation
+    cleaned = _NON_DIGIT_RE.sub('', v)
+
+    # Must be either 5 or 9 digits
+    if len(cleaned) not in [5, 9]:
+        raise ValueError('ZIP code must be 5 digits (XXXXX) or 9 digits (XXXXX-XXXX)')
+
+    # Format appropriately
+    if len(cleaned) == 5:
+        return cleaned
+    else:
+        return f"{cleaned[:5]}-{cleaned[5:]}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_phone(v: str) -> str:
+    # Remove all non-numeric characters
+    cleaned = _NON_DIGIT_RE.sub('', v)
+
+    # 10 digits is a US number without country code; 11-15 already carry one
+    # (a US number with its leading 1 comes out the same as any international number)
+    prefix = _PHONE_PREFIX.get(len(cleaned))
+    if prefix is None:
+        raise ValueError('Phone number must be 10-15 digits')
+    return prefix + cleaned
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_email(v: str) -> str:
+    # Empty strings pass through unchanged (there is no min_length on email)
+    if not v:
+        return v
+    v = v.lower().strip()
+    # More comprehensive email validation
+    if not _EMAIL_RE.match(v):
+        raise ValueError('Invalid email format')
+
+    # Additional checks (a trailing dot and a dotless domain already fail _EMAIL_RE,
+    # which ends in \.[a-zA-Z]{2,} after the @)
+    if '..' in v:
+        raise ValueError('Email cannot contain consecutive dots')
+    if v.startswith('.'):
+        raise ValueError('Email cannot start or end with a dot')
+
+    return v
+
+
+_SSN = Annotated[str, StringConstraints(min_length=11, max_length=11), AfterValidator(_clean_ssn)]
+_State = Annotated[str, StringConstraints(min_length=2, max_length=2), AfterValidator(_clean_state)]
+_Zip = Annotated[str, StringConstraints(min_length=5, max_length=10), AfterValidator(_clean_zip)]
+_Phone = Annotated[str, StringConstraints(min_length=10, max_length=15), AfterValidator(_clean_phone)]
+_Email = Annotated[str, StringConstraints(max_length=255), AfterValidator(_clean_email)]
+
 
 class PrincipalBase(BaseModel):
     merchant_id: int = Field(..., gt=0)
@@ -28,10 +157,8 @@ class PrincipalBase(BaseModel):
         decimal_places=2,
         description="Ownership percentage (0-100)"
     )
-    ssn: Optional[str] = Field(
+    ssn: Optional[_SSN] = Field(
         None,
-        min_length=11,
-        max_length=11,
         description="Social Security Number (XXX-XX-XXXX)"
     )
     date_of_birth: Optional[date] = Field(
@@ -49,27 +176,20 @@ class PrincipalBase(BaseModel):
         max_length=100,
         description="City"
     )
-    state: Optional[str] = Field(
+    state: Optional[_State] = Field(
         None,
-        min_length=2,
-        max_length=2,
         description="Two-letter state code"
     )
-    zip: Optional[str] = Field(
+    zip: Optional[_Zip] = Field(
         None,
-        min_length=5,
-        max_length=10,
         description="ZIP code (XXXXX or XXXXX-XXXX)"
     )
-    phone: Optional[str] = Field(
+    phone: Optional[_Phone] = Field(
         None,
-        min_length=10,
-        max_length=15,
         description="Phone number"
     )
-    email: Optional[str] = Field(
+    email: Optional[_Email] = Field(
         None,
-        max_length=255,
         description="Email address"
     )
     is_primary_contact: bool = Field(
@@ -82,48 +202,7 @@ class PrincipalBase(BaseModel):
     )
 
     # Validators
-    @field_validator('first_name', 'last_name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if v:
-            # Remove extra whitespace and strip
-            v = ' '.join(v.split()).strip()
-            # Check for valid characters
-            if not re.match(r"^[a-zA-Z\s\-'.]+$", v):
-                raise ValueError('Name can only contain letters, spaces, hyphens, and apostrophes')
-            # Check for minimum meaningful length
-            if len(v.replace(' ', '').replace('-', '').replace("'", '').replace('.', '')) < 1:
-                raise ValueError('Name must contain at least one letter')
-        return v
-
-    @field_validator('ssn')
-    @classmethod
-    def validate_ssn(cls, v: Optional[str]) -> Optional[str]:
-        if v:
-            # Remove any non-numeric characters
-            cleaned = re.sub(r'[^0-9]', '', v)
-            if len(cleaned) != 9:
-                raise ValueError('SSN must contain exactly 9 digits')
-
-            # Format as XXX-XX-XXXX
-            formatted_ssn = f"{cleaned[:3]}-{cleaned[3:5]}-{cleaned[5:]}"
-
-            # Validate SSN rules
-            # First three digits can't be 000, 666, or 900-999
-            first_three = int(cleaned[:3])
-            if first_three == 0 or first_three == 666 or first_three >= 900:
-                raise ValueError('Invalid SSN: Invalid area number')
-
-            # Middle two digits can't be 00
-            if cleaned[3:5] == '00':
-                raise ValueError('Invalid SSN: Invalid group number')
-
-            # Last four digits can't be 0000
-            if cleaned[5:] == '0000':
-                raise ValueError('Invalid SSN: Invalid serial number')
-
-            return formatted_ssn
-        return v
+    _validate_name = field_validator('first_name', 'last_name')(_clean_name)
 
     # @field_validator('date_of_birth')
     # @classmethod
@@ -142,99 +221,16 @@ class PrincipalBase(BaseModel):
     #             raise ValueError('Invalid date of birth: unrealistic age')
     #     return v
 
-    @field_validator('state')
-    @classmethod
-    def validate_state(cls, v: Optional[str]) -> Optional[str]:
-        if v:
-            v = v.upper().strip()
-            valid_states = {
-                'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FL',
-                'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME',
-                'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH',
-                'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI',
-                'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI',
-                'WY', 'PR', 'VI', 'GU', 'AS', 'MP'  # Include territories
-            }
-            if v not in valid_states:
-                raise ValueError(f'Invalid state code: {v}')
-        return v
-
-    @field_validator('zip')
-    @classmethod
-    def validate_zip(cls, v: Optional[str]) -> Optional[str]:
-        if v:
-            # Remove any spaces or hyphens for validation
-            cleaned = re.sub(r'[^0-9]', '', v)
-
-            # Must be either 5 or 9 digits
-            if len(cleaned) not in [5, 9]:
-                raise ValueError('ZIP code must be 5 digits (XXXXX) or 9 digits (XXXXX-XXXX)')
-
-            # Format appropriately
-            if len(cleaned) == 5:
-                return cleaned
-            else:
-                return f"{cleaned[:5]}-{cleaned[5:]}"
-        return v
-
-    @field_validator('phone')
-    @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            # Remove all non-numeric characters
-            cleaned = re.sub(r'[^0-9]', '', v)
-
-            # Handle different phone formats
-            if len(cleaned) == 10:
-                # US number without country code
-                return f"+1{cleaned}"
-            elif len(cleaned) == 11 and cleaned[0] == '1':
-                # US number with country code
-                return f"+{cleaned}"
-            elif 10 <= len(cleaned) <= 15:
-                # International number
-                return f"+{cleaned}"
-            else:
-                raise ValueError('Phone number must be 10-15 digits')
-        return v
-
-    @field_validator('email')
-    @classmethod
-    def validate_email(cls, v: Optional[str]) -> Optional[str]:
-        if v:
-            v = v.lower().strip()
-            # More comprehensive email validation
-            email_pattern = re.compile(
-                r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            )
-            if not email_pattern.match(v):
-                raise ValueError('Invalid email format')
-
-            # Additional checks
-            if '..' in v:
-                raise ValueError('Email cannot contain consecutive dots')
-            if v.startswith('.') or v.endswith('.'):
-                raise ValueError('Email cannot start or end with a dot')
-
-            # Check domain has at least one dot after @
-            domain = v.split('@')[1]
-            if '.' not in domain:
-                raise ValueError('Email domain must contain at least one dot')
-
-        return v
-
     @model_validator(mode='after')
     def validate_address_completeness(self):
         """If any address field is provided, require city, state, and zip"""
-        address = self.home_address
-        city = self.city
-        state = self.state
-        zip_code = self.zip
-
-        address_fields = [address, city, state, zip_code]
-        provided_fields = [f for f in address_fields if f is not None]
+        # Count the provided fields without building intermediate lists
+        provided = (
+            (self.home_address is not None) + (self.city is not None)
+            + (self.state is not None) + (self.zip is not None)
+        )
 
-        if provided_fields and len(provided_fields) < 4:
+        if 0 < provided < 4:
             raise ValueError(
                 'If any address field is provided, all address fields '
                 '(home_address, city, state, zip) are required'
@@ -264,47 +260,23 @@ class PrincipalUpdate(BaseModel):
         max_digits=5,
         decimal_places=2
     )
-    ssn: Optional[str] = Field(None, min_length=11, max_length=11)
+    ssn: Optional[_SSN] = None
     date_of_birth: Optional[date] = None
     home_address: Optional[str] = Field(None, max_length=500)
     city: Optional[str] = Field(None, min_length=2, max_length=100)
-    state: Optional[str] = Field(None, min_length=2, max_length=2)
-    zip: Optional[str] = Field(None, min_length=5, max_length=10)
-    phone: Optional[str] = Field(None, min_length=10, max_length=15)
-    email: Optional[str] = Field(None, max_length=255)
+    state: Optional[_State] = None
+    zip: Optional[_Zip] = None
+    phone: Optional[_Phone] = None
+    email: Optional[_Email] = None
     is_primary_contact: Optional[bool] = None
     is_guarantor: Optional[bool] = None
 
-    # Apply the same validators as PrincipalBase
-    _validate_name = field_validator('first_name', 'last_name')(PrincipalBase.validate_name)
-    _validate_ssn = field_validator('ssn')(PrincipalBase.validate_ssn)
+    # Apply the same validators as PrincipalBase (the optional fields carry theirs in their types)
+    _validate_name = field_validator('first_name', 'last_name')(_clean_name)
     # _validate_date_of_birth = field_validator('date_of_birth')(PrincipalBase.validate_date_of_birth)
-    _validate_state = field_validator('state')(PrincipalBase.validate_state)
-    _validate_zip = field_validator('zip')(PrincipalBase.validate_zip)
-    _validate_phone = field_validator('phone')(PrincipalBase.validate_phone)
-    _validate_email = field_validator('email')(PrincipalBase.validate_email)
 
-    @model_validator(mode='after')
-    def validate_partial_address_update(self):
-        """For updates, if any address field is provided, validate completeness"""
-        address_fields = {
-            'home_address': self.home_address,
-            'city': self.city,
-            'state': self.state,
-            'zip': self.zip
-        }
-
-        # Filter out None values to see what's being updated
-        updating_fields = {k: v for k, v in address_fields.items() if v is not None}
-
-        # If updating any address field, warn about incomplete address
-        # Note: This is less strict than create since it's a partial update
-        if updating_fields and len(updating_fields) < 4:
-            # This is a warning, not an error for updates
-            # You might want to log this or handle it differently
-            pass
-
-        return self
+    # Partial address updates are not checked for completeness (less strict than create),
+    # so there is no model validator here
 
 
 class Principal(PrincipalBase):
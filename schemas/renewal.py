@@ -1,8 +1,9 @@
 # app/schemas/renewal.py
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Literal, Optional, List
+from typing_extensions import TypedDict
 from enum import Enum
 
 
@@ -12,6 +13,10 @@ class RenewalStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# String values of RenewalStatus for the schema fields (see DealStatusValue)
+RenewalStatusValue = Literal["active", "reversed", "cancelled"]
+
+
 # RenewalInfo Schemas
 class RenewalInfoBase(BaseModel):
     old_deal_id: int = Field(..., description="ID of the old deal being paid off")
@@ -21,11 +26,7 @@ class RenewalInfoBase(BaseModel):
     payoff_date: Optional[date] = None
     notes: Optional[str] = Field(None, max_length=1000)
 
-    @validator('transfer_balance')
-    def validate_transfer_balance(cls, v):
-        if v <= 0:
-            raise ValueError('Transfer balance must be greater than 0')
-        return v
+    model_config = ConfigDict(frozen=True)
 
 
 class RenewalInfoCreate(RenewalInfoBase):
@@ -43,8 +44,7 @@ class RenewalInfo(RenewalInfoBase):
     id: int
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # DealRenewalJunction Schemas
@@ -52,6 +52,8 @@ class DealRenewalJunctionBase(BaseModel):
     deal_id: int = Field(..., description="ID of the new renewal deal")
     renewal_info_id: int = Field(..., description="ID of the renewal info record")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class DealRenewalJunctionCreate(DealRenewalJunctionBase):
     pass
@@ -61,8 +63,7 @@ class DealRenewalJunction(DealRenewalJunctionBase):
     id: int
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # DealRenewalRelationship Schemas
@@ -70,7 +71,9 @@ class DealRenewalRelationshipBase(BaseModel):
     old_deal_id: int = Field(..., description="ID of the old deal that was renewed")
     new_deal_id: int = Field(..., description="ID of the new renewal deal")
     renewal_info_id: int = Field(..., description="ID of the renewal info record")
-    status: RenewalStatus = Field(default=RenewalStatus.ACTIVE)
+    status: RenewalStatusValue = Field(default="active")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class DealRenewalRelationshipCreate(DealRenewalRelationshipBase):
@@ -78,7 +81,7 @@ class DealRenewalRelationshipCreate(DealRenewalRelationshipBase):
 
 
 class DealRenewalRelationshipUpdate(BaseModel):
-    status: Optional[RenewalStatus] = None
+    status: Optional[RenewalStatusValue] = None
 
 
 class DealRenewalRelationship(DealRenewalRelationshipBase):
@@ -86,8 +89,7 @@ class DealRenewalRelationship(DealRenewalRelationshipBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Renewal Process Schemas
@@ -96,7 +98,9 @@ class RenewalDealInfo(BaseModel):
     old_deal_id: int
     transfer_balance: Decimal = Field(..., gt=0, decimal_places=2)
     payoff_date: Optional[date] = None
-    notes: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=1000)
+
+    model_config = ConfigDict(frozen=True)
 
 
 class CreateRenewalDeal(BaseModel):
@@ -110,10 +114,12 @@ class CreateRenewalDeal(BaseModel):
     first_payment_date: date
 
     # Renewal specific
-    old_deals: List[RenewalDealInfo] = Field(..., min_items=1, description="List of old deals being renewed")
+    old_deals: List[RenewalDealInfo] = Field(
+        ..., min_length=1, max_length=50, description="List of old deals being renewed"
+    )
 
     # Administrative
-    notes: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=2000)
     created_by: Optional[str] = None
 
 
@@ -130,6 +136,21 @@ class RenewalSummary(BaseModel):
     created_at: datetime
 
 
+# Typed shapes for the RenewalChain links, so they validate against a fixed schema
+# instead of as free-form dicts
+class RenewedInto(TypedDict):
+    deal_id: int
+    deal_number: str
+    renewal_date: date
+
+
+class RenewedFrom(TypedDict):
+    deal_id: int
+    deal_number: str
+    transfer_balance: float
+    payoff_date: Optional[date]
+
+
 class RenewalChain(BaseModel):
     """Shows the complete renewal chain for a deal"""
     deal_id: int
@@ -137,8 +158,8 @@ class RenewalChain(BaseModel):
 
     # If this deal was renewed
     was_renewed: bool
-    renewed_into: Optional[dict] = None  # {deal_id, deal_number, renewal_date}
+    renewed_into: Optional[RenewedInto] = None
 
     # If this deal is a renewal
     is_renewal: bool
-    renewed_from: List[dict] = []  # [{deal_id, deal_number, transfer_balance}]
\ No newline at end of file
+    renewed_from: List[RenewedFrom] = []
\ No newline at end of file
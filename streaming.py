@@ -0,0 +1,40 @@
+# app/streaming.py
+from typing import AsyncIterator, Type
+
+import orjson
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+from app.schemas import from_orm_fast
+
+# Rows fetched per round trip from the server-side cursor
+STREAM_BATCH_SIZE = 200
+
+
+async def _json_array(rows: AsyncResult, schema: Type[BaseModel]) -> AsyncIterator[bytes]:
+    """Serialize rows into a JSON array one schema at a time"""
+    yield b"["
+    first = True
+    async for row in rows:
+        if not first:
+            yield b","
+        yield orjson.dumps(from_orm_fast(schema, row).model_dump(mode="json"))
+        first = False
+    yield b"]"
+
+
+async def stream_json_list(db: AsyncSession, stmt, schema: Type[BaseModel]) -> StreamingResponse:
+    """
+    Stream the ORM rows of a select() as a JSON array.
+    Rows come off a server-side cursor in batches and are converted to `schema` (without
+    re-running its validators) as they are written, so neither the full ORM list nor the
+    full body is held in memory.
+
+    The rows are read from `db` after the route has returned. That only works because
+    FastAPI 0.104 (pinned in requirements.txt) closes yield dependencies such as
+    get_async_db after the response is sent. From 0.106 they close before the response,
+    which would end the session mid-stream, so check this before upgrading FastAPI.
+    """
+    rows = await db.stream_scalars(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+    return StreamingResponse(_json_array(rows, schema), media_type="application/json")
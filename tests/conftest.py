@@ -1,9 +1,13 @@
 # app/tests/conftest.py
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
 from typing import Generator
+import contextlib
 import os
 import sys
 from datetime import date, datetime
@@ -13,13 +17,19 @@ from decimal import Decimal
 # This allows us to import from 'app' package
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+# Lazy relationship loads in list queries raise under test (read by app.database at import)
+os.environ.setdefault("SQLALCHEMY_RAISELOAD", "1")
+
 # Now we can import from app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_async_db
+from app.cache import CACHE_PREFIX, request_key_builder
 from main import app
-from models import *  # Import all models
+from app import models as _models  # noqa: F401 - registers every table on Base.metadata
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite:///./test_mca_crm.db"
+# Test database file, one per pytest-xdist worker so parallel runs don't share tables
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DB_FILE = f"test_mca_crm_{_XDIST_WORKER}.db" if _XDIST_WORKER else "test_mca_crm.db"
+TEST_DATABASE_URL = f"sqlite:///./{TEST_DB_FILE}"
 
 # Create test engine
 engine = create_engine(
@@ -30,26 +40,69 @@ engine = create_engine(
 # Create test session
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine/session on the same test database for the async routes
+async_engine = create_async_engine(f"sqlite+aiosqlite:///./{TEST_DB_FILE}")
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
-@pytest.fixture(scope="function")
-def db_session() -> Generator[Session, None, None]:
-    """Create a fresh database session for each test"""
-    # Create tables
+
+# The test database is throwaway: skip fsync on commit and keep temp data in memory.
+# WAL lets the sync and async engines read while the other one writes.
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def _test_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _remove_test_db():
+    """Remove test database file (and its WAL side files) if it exists"""
+    for path in (TEST_DB_FILE, f"{TEST_DB_FILE}-wal", f"{TEST_DB_FILE}-shm"):
+        if os.path.exists(path):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_schema():
+    """Create the tables once for the whole run (on a fresh file) and remove it at the end"""
+    _remove_test_db()
     Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    _remove_test_db()
 
-    # Create session
+
+@pytest.fixture(scope="function")
+def db_session() -> Generator[Session, None, None]:
+    """Create a database session for each test, starting from empty tables"""
     session = TestingSessionLocal()
 
     try:
         yield session
     finally:
         session.close()
-        # Clean up - drop all tables after test
-        Base.metadata.drop_all(bind=engine)
+        # Clear the rows instead of rebuilding the schema. The async routes write through
+        # their own aiosqlite engine, so a rollback on this connection would not undo them.
+        with engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
+
+
+@pytest.fixture(scope="session")
+def _test_client() -> Generator[TestClient, None, None]:
+    """One TestClient (and app lifespan) for the whole run"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
+def client(_test_client: TestClient, db_session: Session) -> Generator[TestClient, None, None]:
     """Create a test client with overridden database dependency"""
 
     def override_get_db():
@@ -58,10 +111,22 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
-    app.dependency_overrides[get_db] = override_get_db
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as async_session:
+            yield async_session
 
-    with TestClient(app) as test_client:
-        yield test_client
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    # Fresh in-process cache per test instead of Redis. init() is a no-op once the cache is
+    # set up, and InMemoryBackend keeps its store on the class, so both are reset explicitly
+    # (row ids restart at 1 each test, so a leftover entry would answer for the wrong rows).
+    # Clearing the store also drops the stale-fallback copies.
+    FastAPICache.reset()
+    InMemoryBackend._store.clear()
+    FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX, key_builder=request_key_builder)
+    _test_client.cookies.clear()
+    yield _test_client
 
     app.dependency_overrides.clear()
 
@@ -211,16 +276,3 @@ def create_test_principal(db_session: Session):
         return principal
 
     return _create_principal
-
-
-# Cleanup fixture
-@pytest.fixture(autouse=True)
-def cleanup_test_db():
-    """Ensure test database is cleaned up"""
-    yield
-    # Remove test database file if it exists
-    if os.path.exists("test_mca_crm.db"):
-        try:
-            os.remove("test_mca_crm.db")
-        except:
-            pass
\ No newline at end of file
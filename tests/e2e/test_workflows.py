@@ -186,6 +186,7 @@ class TestPaymentProcessingWorkflow:
 
     def test_payment_processing_workflow(self, client, create_test_merchant):
         """Test payment recording and balance updates"""
+        today = date.today()
         # Setup: Create funded deal
         merchant = create_test_merchant()
 
@@ -204,28 +205,31 @@ class TestPaymentProcessingWorkflow:
         # Select offer
         client.patch(f"/offers/{offer_id}/status/selected")
 
-        # Create deal
+        # Create deal (funded five days ago, so its payments are not future-dated)
         deal_data = {
             "merchant_id": merchant.id,
             "offer_id": offer_id,
-            "funding_date": str(date.today()),
-            "first_payment_date": str(date.today())
+            "funding_date": str(today - timedelta(days=5)),
+            "first_payment_date": str(today - timedelta(days=4))
         }
         deal_response = client.post("/api/v1/deals/", json=deal_data)
         deal_id = deal_response.json()["id"]
 
-        # Record payments
+        # Record payments, one a day up to today
         payment_amount = 650  # 10% of RTR (13,000)
-        for i in range(5):
-            payment_data = {
+        payments_data = [
+            {
                 "deal_id": deal_id,
-                "date": str(date.today() + timedelta(days=i)),
+                "date": str(today - timedelta(days=4 - i)),
                 "amount": payment_amount,
                 "type": "ACH",
                 "notes": f"Payment {i + 1}"
             }
-            response = client.post("/api/v1/payments/", json=payment_data)
-            assert response.status_code == 201
+            for i in range(5)
+        ]
+        response = client.post("/api/v1/payments/bulk", json=payments_data)
+        assert response.status_code == 201
+        assert len(response.json()) == 5
 
         # Update deal balance
         balance_response = client.patch(f"/api/v1/deals/{deal_id}/balance")
@@ -239,7 +243,7 @@ class TestPaymentProcessingWorkflow:
         # Test bounced payment
         bounced_payment_data = {
             "deal_id": deal_id,
-            "date": str(date.today() + timedelta(days=5)),
+            "date": str(today),
             "amount": payment_amount,
             "type": "ACH",
             "bounced": True,
@@ -261,6 +265,9 @@ class TestRenewalWorkflow:
 
     def test_renewal_workflow(self, client, create_test_merchant):
         """Test renewing existing deals"""
+        today = date.today()
+        # Payment dates for each old deal, built once for both deals
+        payment_dates = [str(today - timedelta(days=29 - j)) for j in range(10)]
         merchant = create_test_merchant()
 
         # Create two existing deals to renew
@@ -284,21 +291,24 @@ class TestRenewalWorkflow:
             deal_data = {
                 "merchant_id": merchant.id,
                 "offer_id": offer_id,
-                "funding_date": str(date.today() - timedelta(days=30)),
-                "first_payment_date": str(date.today() - timedelta(days=29))
+                "funding_date": str(today - timedelta(days=30)),
+                "first_payment_date": str(today - timedelta(days=29))
             }
             deal_response = client.post("/api/v1/deals/", json=deal_data)
             deal = deal_response.json()
 
-            # Record some payments (leaving balance)
-            for j in range(10):
-                payment_data = {
+            # Record some payments (leaving balance); Decimal fields come back as JSON strings
+            # and are passed through as-is rather than round-tripped through float
+            payments_data = [
+                {
                     "deal_id": deal["id"],
-                    "date": str(date.today() - timedelta(days=29 - j)),
-                    "amount": float(deal["payment_amount"]),
+                    "date": payment_dates[j],
+                    "amount": deal["payment_amount"],
                     "type": "ACH"
                 }
-                client.post("/api/v1/payments/", json=payment_data)
+                for j in range(10)
+            ]
+            client.post("/api/v1/payments/bulk", json=payments_data)
 
             # Update balance
             client.patch(f"/api/v1/deals/{deal['id']}/balance")
@@ -306,7 +316,7 @@ class TestRenewalWorkflow:
             old_deals.append(deal)
 
         # Create renewal offer
-        total_balance = sum(float(d["balance_remaining"]) for d in old_deals)
+        total_balance = sum(Decimal(d["balance_remaining"]) for d in old_deals)
         renewal_offer_data = {
             "merchant_id": merchant.id,
             "advance": 50000,  # New advance
@@ -338,18 +348,18 @@ class TestRenewalWorkflow:
             "merchant_id": merchant.id,
             "offer_id": renewal_offer_id,
             "bank_account_id": bank_account_id,
-            "funding_date": str(date.today()),
-            "first_payment_date": str(date.today() + timedelta(days=7)),
+            "funding_date": str(today),
+            "first_payment_date": str(today + timedelta(days=7)),
             "old_deals": [
                 {
                     "old_deal_id": old_deals[0]["id"],
-                    "transfer_balance": float(old_deals[0]["balance_remaining"]),
-                    "payoff_date": str(date.today())
+                    "transfer_balance": old_deals[0]["balance_remaining"],
+                    "payoff_date": str(today)
                 },
                 {
                     "old_deal_id": old_deals[1]["id"],
-                    "transfer_balance": float(old_deals[1]["balance_remaining"]),
-                    "payoff_date": str(date.today())
+                    "transfer_balance": old_deals[1]["balance_remaining"],
+                    "payoff_date": str(today)
                 }
             ],
             "notes": "Renewal of two existing deals",
@@ -363,9 +373,10 @@ class TestRenewalWorkflow:
 
         # Verify renewal deal details
         assert renewal_deal["is_renewal"] is True
-        assert float(renewal_deal["total_transfer_balance"]) > 0
-        expected_net_cash = 50000 - 1000 - float(renewal_deal["total_transfer_balance"])
-        assert float(renewal_deal["net_cash_to_merchant"]) == expected_net_cash
+        total_transfer_balance = Decimal(renewal_deal["total_transfer_balance"])
+        assert total_transfer_balance > 0
+        expected_net_cash = 50000 - 1000 - total_transfer_balance
+        assert Decimal(renewal_deal["net_cash_to_merchant"]) == expected_net_cash
 
         # Verify old deals marked as renewed
         for old_deal in old_deals:
@@ -3,6 +3,26 @@ from fastapi import status
 from datetime import date, datetime, timedelta
 
 
+def _create_deal(client, merchant_id):
+    """Create an offer, select it and fund a deal from it; returns the deal id"""
+    offer_response = client.post("/offers/", json={
+        "merchant_id": merchant_id,
+        "advance": 20000,
+        "factor": 1.2,
+        "specified_percentage": 10.0
+    })
+    offer_id = offer_response.json()["id"]
+    client.patch(f"/offers/{offer_id}/status/selected")
+
+    deal_response = client.post("/api/v1/deals/", json={
+        "merchant_id": merchant_id,
+        "offer_id": offer_id,
+        "funding_date": str(date.today()),
+        "first_payment_date": str(date.today())
+    })
+    return deal_response.json()["id"]
+
+
 class TestMerchantAPI:
     """Test merchant API endpoints"""
 
@@ -201,6 +221,49 @@ class TestDealAPI:
         assert "average_factor_rate" in data
 
 
+    def test_get_deal_payment_columns(self, client, create_test_merchant):
+        """Test GET /api/v1/deals/{id}/payment-columns lines the arrays up by payment"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        created = client.post("/api/v1/payments/bulk", json=[
+            {"deal_id": deal_id, "date": str(date.today() - timedelta(days=2)), "amount": "100.00", "type": "ACH"},
+            {"deal_id": deal_id, "date": str(date.today() - timedelta(days=1)), "amount": "200.00", "type": "Wire",
+             "bounced": True},
+            {"deal_id": deal_id, "date": str(date.today()), "amount": "300.00", "type": "Check"}
+        ]).json()
+
+        response = client.get(f"/api/v1/deals/{deal_id}/payment-columns")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["id"] == deal_id
+        columns = data["payment_columns"]
+        assert all(len(values) == 3 for values in columns.values())
+
+        # Newest first; index i of every array describes the same payment
+        expected = sorted(created, key=lambda payment: payment["date"], reverse=True)
+        assert columns["ids"] == [payment["id"] for payment in expected]
+        assert [float(amount) for amount in columns["amounts"]] == [300.00, 200.00, 100.00]
+        assert columns["types"] == ["Check", "Wire", "ACH"]
+        assert columns["bounced"] == [False, True, False]
+        assert [value[:10] for value in columns["dates"]] == [payment["date"][:10] for payment in expected]
+
+    def test_get_deal_payment_columns_no_payments(self, client, create_test_merchant):
+        """Test a deal without payments returns empty arrays"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+
+        response = client.get(f"/api/v1/deals/{deal_id}/payment-columns")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["payment_columns"] == {
+            "ids": [], "dates": [], "amounts": [], "types": [], "bounced": []
+        }
+
+    def test_get_deal_payment_columns_not_found(self, client):
+        """Test payment columns for a non-existent deal"""
+        response = client.get("/api/v1/deals/99999/payment-columns")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestPaymentAPI:
     """Test payment API endpoints"""
 
@@ -282,6 +345,179 @@ class TestPaymentAPI:
         assert float(data["total_amount"]) == 1200.00
         assert data["average_payment"] == 400.00
 
+    def test_create_payments_bulk(self, client, create_test_merchant):
+        """Test POST /api/v1/payments/bulk"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        payments_data = [
+            {
+                "deal_id": deal_id,
+                "date": str(date.today() - timedelta(days=i)),
+                "amount": "400.00",
+                "type": "ACH"
+            }
+            for i in range(3)
+        ]
+
+        response = client.post("/api/v1/payments/bulk", json=payments_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert len(data) == 3
+        assert len({payment["id"] for payment in data}) == 3
+        assert all(payment["deal_id"] == deal_id for payment in data)
+
+    def test_create_payments_bulk_is_all_or_nothing(self, client, create_test_merchant):
+        """Test one invalid item rejects the whole batch and nothing is inserted"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        payments_data = [
+            {"deal_id": deal_id, "date": str(date.today()), "amount": "400.00", "type": "ACH"},
+            {"deal_id": deal_id, "date": str(date.today()), "amount": "-5.00", "type": "ACH"}
+        ]
+
+        response = client.post("/api/v1/payments/bulk", json=payments_data)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        payments = client.get(f"/api/v1/payments/?deal_id={deal_id}").json()
+        assert payments["data"] == []
+
+    def test_create_payments_bulk_limits(self, client):
+        """Test the bulk endpoint rejects empty and oversized batches"""
+        payment = {"deal_id": 1, "date": str(date.today()), "amount": "1.00", "type": "ACH"}
+
+        response = client.post("/api/v1/payments/bulk", json=[])
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = client.post("/api/v1/payments/bulk", json=[payment] * 1001)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert client.get("/api/v1/payments/").json()["data"] == []
+
+    def test_list_payments_cursor_pages(self, client, create_test_merchant):
+        """Test walking GET /api/v1/payments/ by next_cursor when payment dates tie"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        same_day = str(date.today())
+        created = client.post("/api/v1/payments/bulk", json=[
+            {"deal_id": deal_id, "date": same_day, "amount": "100.00", "type": "ACH"}
+            for _ in range(5)
+        ]).json()
+
+        seen = []
+        pages = []
+        cursor = None
+        while True:
+            params = {"limit": 2, "deal_id": deal_id}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/v1/payments/", params=params)
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            pages.append(len(page["data"]))
+            seen.extend(payment["id"] for payment in page["data"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        # Same date throughout, so the id tie-breaker alone decides the order
+        assert pages == [2, 2, 1]
+        assert seen == sorted((payment["id"] for payment in created), reverse=True)
+
+    def test_list_payments_last_page_has_no_cursor(self, client, create_test_merchant):
+        """Test next_cursor is null when everything fits on one page"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        client.post("/api/v1/payments/bulk", json=[
+            {"deal_id": deal_id, "date": str(date.today()), "amount": "100.00", "type": "ACH"}
+        ])
+
+        data = client.get("/api/v1/payments/", params={"limit": 2}).json()
+
+        assert len(data["data"]) == 1
+        assert data["next_cursor"] is None
+
+    def test_list_payments_invalid_cursor(self, client):
+        """Test a malformed cursor is rejected with 400"""
+        response = client.get("/api/v1/payments/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # Valid base64, but not a "date|id" pair
+        response = client.get("/api/v1/payments/", params={"cursor": "bm90LWEtY3Vyc29y"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_payments_streams_json_array(self, client, create_test_merchant):
+        """Test GET /api/v1/payments/export returns every matching payment as one JSON array"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        created = client.post("/api/v1/payments/bulk", json=[
+            {"deal_id": deal_id, "date": str(date.today() - timedelta(days=i)), "amount": "250.00", "type": "ACH"}
+            for i in range(3)
+        ]).json()
+
+        response = client.get("/api/v1/payments/export", params={"deal_id": deal_id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()  # fails unless the streamed chunks form valid JSON
+        assert isinstance(data, list)
+        assert sorted(payment["id"] for payment in data) == sorted(payment["id"] for payment in created)
+        assert all(float(payment["amount"]) == 250.00 for payment in data)
+
+    def test_streamed_lists_empty(self, client):
+        """Test the streamed endpoints return an empty JSON array when nothing matches"""
+        for url in (
+            "/api/v1/payments/export?deal_id=99999",
+            "/api/v1/payments/deals/99999/payments",
+            "/merchants/99999/offers/"
+        ):
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.content == b"[]"
+
+    def test_get_payment_etag(self, client, create_test_merchant):
+        """Test conditional GET on a single payment"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        payment_id = client.post("/api/v1/payments/", json={
+            "deal_id": deal_id, "date": str(date.today()), "amount": "500.00", "type": "ACH"
+        }).json()["id"]
+        url = f"/api/v1/payments/{payment_id}"
+
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["etag"]
+
+        # Unchanged row - 304 with no body
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+        # Bounce it right away, usually within the same second (updated_at may not
+        # move on SQLite) - the ETag still changes and the new state is returned
+        client.patch(f"{url}/bounce")
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+        assert response.json()["bounced"] is True
+
+    def test_payment_summary_conditional_get(self, client, create_test_merchant):
+        """Test the cached summary sends an ETag and answers a matching If-None-Match with 304"""
+        deal_id = _create_deal(client, create_test_merchant().id)
+        url = f"/api/v1/payments/deals/{deal_id}/summary"
+
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["x-cache-status"] == "miss"
+        etag = response.headers["etag"]
+
+        # Cache hit the client already holds - 304 with no body
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["x-cache-status"] == "hit"
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        # Cache hit with an old ETag - full body, same ETag as the miss
+        response = client.get(url, headers={"If-None-Match": '"outdated"'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["x-cache-status"] == "hit"
+        assert response.headers["etag"] == etag
+        assert response.json()["total_payments"] == 0
+
 
 class TestRenewalAPI:
     """Test renewal API endpoints"""
@@ -430,6 +666,32 @@ class TestRenewalAPI:
         assert len(data["merchants"]) == 2
         assert data["page"] == 2
 
+    def test_list_merchants_etag(self, client, sample_merchant_data):
+        """Test conditional GET on merchant list"""
+        merchant_id = client.post("/api/v1/merchants/", json=sample_merchant_data).json()["id"]
+
+        response = client.get("/api/v1/merchants/")
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["etag"]
+
+        # Unchanged table - 304 with no body
+        response = client.get("/api/v1/merchants/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # Edit right after the read, usually within the same second (SQLite keeps the same
+        # updated_at) - the ETag still changes
+        client.put(f"/api/v1/merchants/{merchant_id}", json={"contact_person": "Jane Roe"})
+        response = client.get("/api/v1/merchants/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+        etag = response.headers["etag"]
+
+        # New merchant - ETag changes and full list is returned
+        client.post("/api/v1/merchants/", json={"company_name": "Another Company"})
+        response = client.get("/api/v1/merchants/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
     def test_search_merchants(self, client):
         """Test merchant search"""
         # Create test merchants
@@ -625,4 +887,27 @@ class TestOfferAPI:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["id"] == offer_id
-        assert data["advance"] == sample_offer_data["advance"]
\ No newline at end of file
+        assert data["advance"] == sample_offer_data["advance"]
+
+    def test_list_offers_cursor_pages(self, client, create_test_merchant, sample_offer_data):
+        """Test walking GET /offers/ by next_cursor"""
+        merchant = create_test_merchant()
+        sample_offer_data["merchant_id"] = merchant.id
+        offer_ids = [client.post("/offers/", json=sample_offer_data).json()["id"] for _ in range(3)]
+
+        first = client.get("/offers/", params={"limit": 2}).json()
+        assert len(first["data"]) == 2
+        assert first["next_cursor"] is not None
+
+        second = client.get("/offers/", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+        assert len(second["data"]) == 1
+        assert second["next_cursor"] is None
+
+        # Newest first, every offer exactly once
+        seen = [offer["id"] for offer in first["data"] + second["data"]]
+        assert seen == sorted(offer_ids, reverse=True)
+
+    def test_list_offers_invalid_cursor(self, client):
+        """Test a non-integer offer cursor is rejected"""
+        response = client.get("/offers/", params={"cursor": "abc"})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
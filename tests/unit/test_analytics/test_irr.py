@@ -0,0 +1,34 @@
+# app/tests/unit/test_analytics/test_irr.py
+import pytest
+from decimal import Decimal
+from app.analytics.irr import compute_irr, deal_irr
+
+
+class TestComputeIRR:
+    """Test the Newton/bisection IRR solver"""
+
+    def test_single_period(self):
+        """One period at 10% returns exactly 0.1"""
+        assert compute_irr([-100, 110]) == pytest.approx(0.1)
+
+    def test_daily_mca_cashflows_zero_npv(self):
+        """The returned rate discounts a daily payment schedule back to zero"""
+        cashflows = [-10000] + [130] * 100
+        rate = compute_irr(cashflows)
+
+        npv = sum(cf / (1 + rate) ** t for t, cf in enumerate(cashflows))
+        assert npv == pytest.approx(0, abs=1e-6)
+
+    def test_negative_rate(self):
+        """Losses give a negative IRR"""
+        assert compute_irr([-100, 50]) == pytest.approx(-0.5)
+
+    def test_no_sign_change(self):
+        """Cashflows that never change sign have no IRR"""
+        assert compute_irr([100, 50]) is None
+        assert compute_irr([-100, -50]) is None
+
+    def test_deal_irr_quantized(self):
+        """deal_irr rounds to four places as a Decimal"""
+        assert deal_irr([-100, 110]) == Decimal("0.1000")
+        assert deal_irr([100, 50]) is None
@@ -1,7 +1,7 @@
 # app/tests/unit/test_crud/test_merchant_crud.py
 import pytest
 from app.crud.merchant import (
-    create_merchant, get_merchant, get_merchants,
+    create_merchant, get_merchant, get_merchants, get_merchants_with_total,
     update_merchant, delete_merchant, get_merchant_stats,
     DuplicateFEINError, MerchantCRUDError
 )
@@ -81,6 +81,26 @@ class TestMerchantCRUD:
         assert len(page1) == 3
         assert len(page2) == 2
 
+    def test_get_merchants_with_total(self, db_session):
+        """Test the page carries the full match count"""
+        for i in range(5):
+            create_merchant(
+                db_session,
+                MerchantCreate(
+                    company_name=f"Company {i}",
+                    fein=f"22222222{i}"
+                )
+            )
+
+        page, total = get_merchants_with_total(db_session, skip=3, limit=3)
+        assert len(page) == 2
+        assert total == 5
+
+        # Past the last page the total is still reported
+        page, total = get_merchants_with_total(db_session, skip=10, limit=3)
+        assert page == []
+        assert total == 5
+
     def test_get_merchants_with_filters(self, db_session):
         """Test merchant filtering"""
         # Create merchants with different statuses
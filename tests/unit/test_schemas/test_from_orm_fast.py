@@ -0,0 +1,43 @@
+# app/tests/unit/test_schemas/test_from_orm_fast.py
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.schemas import from_orm_fast
+from app.schemas.offer import Offer
+
+
+def _offer_row(**overrides):
+    """Stand-in for an Offer ORM row (attribute access only)"""
+    now = datetime(2024, 1, 15, 12, 0)
+    values = dict(
+        id=1, merchant_id=1, advance=Decimal("10000.00"), factor=Decimal("1.350"),
+        upfront_fees=Decimal("500.00"), upfront_fee_percentage=Decimal("0.00"),
+        specified_percentage=Decimal("10.00"), payment_frequency="daily", renewal=False,
+        transfer_balance=Decimal("0.00"), deal_id=None, status="draft",
+        payment_amount=None, number_of_periods=None, rtr=None, net_funds=None, apr=None,
+        created_at=now, updated_at=now, sent_at=None, selected_at=None, funded_at=None
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestFromOrmFast:
+    """Test building read schemas from ORM rows without validation"""
+
+    def test_matches_model_validate(self):
+        """Test the constructed schema dumps the same as a validated one"""
+        row = _offer_row()
+        fast = from_orm_fast(Offer, row)
+        validated = Offer.model_validate(row)
+
+        assert fast.model_dump(mode="json") == validated.model_dump(mode="json")
+        assert fast.calculated_net_funds == Decimal("9500.00")
+
+    def test_skips_validation(self):
+        """Test stored values are taken as-is rather than re-validated"""
+        row = _offer_row(status="not-a-real-status", number_of_periods="40")
+        offer = from_orm_fast(Offer, row)
+
+        assert offer.status == "not-a-real-status"
+        assert offer.number_of_periods == "40"  # model_validate would coerce this to int